@@ -0,0 +1,68 @@
+"""Profile the client-side cost of sending text messages.
+
+Runs ``send_text`` against an in-process ``httpx.MockTransport`` so the
+profile only contains SDK, pydantic, JSON and httpx work — no network.
+
+    python scripts/profile_send.py                 # top 15 by cumulative time
+    python scripts/profile_send.py -n 20000 -o send.prof
+    python scripts/profile_send.py --bulk          # send_text_bulk instead of a loop
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+
+import httpx
+
+from whatsapp_cloud_api import TextMessage, WhatsAppClient
+
+_RESPONSE = {
+    "messaging_product": "whatsapp",
+    "contacts": [{"input": "5511999999999", "wa_id": "5511999999999"}],
+    "messages": [{"id": "wamid.profile"}],
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=_RESPONSE)
+
+
+async def _run(count: int, bulk: bool) -> None:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    async with WhatsAppClient(access_token="profile", http_client=http) as client:
+        messages = client.messages
+        inputs = [
+            TextMessage(phone_number_id="123", to="5511999999999", body=f"Hello {i}")
+            for i in range(count)
+        ]
+        if bulk:
+            await messages.send_text_bulk(inputs)
+        else:
+            for msg in inputs:
+                await messages.send_text(msg)
+    await http.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=10_000)
+    parser.add_argument("-o", "--output", help="write raw pstats data to this file")
+    parser.add_argument("--bulk", action="store_true", help="use send_text_bulk")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    asyncio.run(_run(args.count, args.bulk))
+    profiler.disable()
+
+    if args.output:
+        profiler.dump_stats(args.output)
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -37,7 +37,7 @@ from .types import (
     SendMessageResponse,
     WebhookMessage,
 )
-from .webhooks import normalize_webhook, verify_signature
+from .webhooks import normalize_webhook, verify_signature, verify_signatures_batch
 
 __all__ = [
     # Client
@@ -80,6 +80,7 @@ __all__ = [
     # Webhooks
     "normalize_webhook",
     "verify_signature",
+    "verify_signatures_batch",
     "NormalizedWebhook",
     "WebhookMessage",
     # Types
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from functools import cached_property
+import asyncio
+import random
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from .errors import GraphApiError
+from .utils import fastjson
 from .utils.case import to_snake_deep
 
 if TYPE_CHECKING:
@@ -17,10 +20,47 @@ if TYPE_CHECKING:
 
 _DEFAULT_BASE_URL = "https://api.kapso.ai/meta/whatsapp"
 _DEFAULT_VERSION = "v24.0"
+# "retry" is also the fallback for unmapped codes (category "unknown"), so it
+# is only trusted for server-side failures; a 4xx without a known code is final.
+_RETRYABLE_CATEGORIES = frozenset({"server", "synchronization"})
+
+
+def _is_retryable(err: GraphApiError) -> bool:
+    action = err.retry.action
+    if action == "retry_after":
+        return True
+    return action == "retry" and (
+        err.http_status >= 500 or err.category in _RETRYABLE_CATEGORIES
+    )
+
+# Endpoint URLs repeat per phone number / resource id. httpx.URL is immutable
+# and httpx reuses a parsed instance as-is, so each URL string is parsed once.
+_parse_url = lru_cache(maxsize=1024)(httpx.URL)
 
 
 class WhatsAppClient:
-    """Async WhatsApp Business Cloud API client backed by httpx."""
+    """Async WhatsApp Business Cloud API client backed by httpx.
+
+    Connection pool sizing only applies to the client created internally
+    (it is ignored when ``http_client`` is given). With HTTP/2 all requests
+    to the API host are multiplexed over a single connection, so the pool
+    mostly matters for bursty workloads and reconnect storms. By default
+    every connection is kept alive so warm connections are never evicted.
+
+    Retries are opt-in via ``max_retries``. Throttling (``"retry_after"``) is
+    retried, and so are ``"retry"`` errors that are server-side: a 5xx status
+    or the ``server``/``synchronization`` categories. Other 4xx responses,
+    including ones with no or an unmapped error code, are never retried. The
+    server's ``Retry-After`` delay is honoured when the header is present,
+    otherwise the delay is exponential backoff with jitter. Either way it is
+    capped at ``retry_backoff_cap`` seconds. Retries apply to every method: a
+    send that failed with a 5xx after reaching the API may be delivered twice,
+    so keep ``max_retries=0`` where duplicate messages are unacceptable.
+
+    With ``validate_responses=False`` the send-message and media responses are
+    built with ``model_construct`` instead of ``model_validate``, trusting the
+    API's JSON and skipping a pydantic validation pass per call.
+    """
 
     def __init__(
         self,
@@ -30,10 +70,31 @@ class WhatsAppClient:
         graph_version: str = _DEFAULT_VERSION,
         http_client: httpx.AsyncClient | None = None,
         timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float = 90.0,
+        max_retries: int = 0,
+        retry_backoff_base: float = 0.5,
+        retry_backoff_cap: float = 30.0,
+        validate_responses: bool = True,
     ) -> None:
         self._access_token = access_token
         self._base_url = base_url.rstrip("/")
         self._version = graph_version
+        self._url_prefix = f"{self._base_url}/{graph_version}/"
+        # The token is fixed per client, so the auth headers are encoded once;
+        # httpx copies a Headers instance without re-encoding it. They are not
+        # installed as httpx default headers: ``fetch_raw`` must not leak the
+        # key to third-party CDNs, and an external ``http_client`` may be
+        # shared with other code.
+        self._auth_headers = httpx.Headers({"X-API-Key": access_token})
+        self._json_headers = httpx.Headers(
+            {"X-API-Key": access_token, "Content-Type": "application/json"}
+        )
+        self._max_retries = max_retries
+        self._retry_backoff_base = retry_backoff_base
+        self._retry_backoff_cap = retry_backoff_cap
+        self._validate_responses = validate_responses
 
         if http_client is not None:
             self._http = http_client
@@ -43,13 +104,23 @@ class WhatsAppClient:
                 http2=True,
                 timeout=httpx.Timeout(timeout),
                 limits=httpx.Limits(
-                    max_connections=100,
-                    max_keepalive_connections=20,
-                    keepalive_expiry=30.0,
+                    max_connections=max_connections,
+                    max_keepalive_connections=(
+                        max_connections
+                        if max_keepalive_connections is None
+                        else max_keepalive_connections
+                    ),
+                    keepalive_expiry=keepalive_expiry,
                 ),
             )
             self._owns_client = True
 
+        self._messages: MessagesResource | None = None
+        self._media: MediaResource | None = None
+        self._templates: TemplatesResource | None = None
+        self._phone_numbers: PhoneNumbersResource | None = None
+        self._flows: FlowsResource | None = None
+
     # ── context manager ──────────────────────────────────────────
 
     async def __aenter__(self) -> WhatsAppClient:
@@ -67,11 +138,17 @@ class WhatsAppClient:
     def _url(self, path: str) -> str:
         if path.startswith("http"):
             return path
-        return f"{self._base_url}/{self._version}/{path.lstrip('/')}"
-
-    @property
-    def _auth_headers(self) -> dict[str, str]:
-        return {"X-API-Key": self._access_token}
+        return self._url_prefix + path.lstrip("/")
+
+    def _merge_auth(
+        self, headers: dict[str, str] | None, *, json_body: bool = False
+    ) -> httpx.Headers:
+        base = self._json_headers if json_body else self._auth_headers
+        if not headers:
+            return base
+        merged = base.copy()
+        merged.update(headers)
+        return merged
 
     # ── core request ─────────────────────────────────────────────
 
@@ -86,17 +163,67 @@ class WhatsAppClient:
         files: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         raw_response: bool = False,
+        snake_case: bool = True,
+    ) -> Any:
+        """Send a request and return the decoded JSON body.
+
+        Keys are converted to snake_case unless ``snake_case=False``. Callers
+        that validate the body into a ``CamelModel`` skip the conversion, since
+        those models accept both the snake_case names and camelCase aliases.
+
+        A ``json`` body is serialized once up front (orjson when installed) and
+        sent as raw content, so retries reuse the same bytes.
+        """
+        content = fastjson.dumps(json) if json is not None else None
+        attempt = 0
+        while True:
+            try:
+                return await self._request_once(
+                    method,
+                    path,
+                    content=content,
+                    params=params,
+                    data=data,
+                    files=files,
+                    headers=headers,
+                    raw_response=raw_response,
+                    snake_case=snake_case,
+                )
+            except GraphApiError as err:
+                if attempt >= self._max_retries or not _is_retryable(err):
+                    raise
+                await asyncio.sleep(self._retry_delay(err, attempt))
+                attempt += 1
+
+    def _retry_delay(self, err: GraphApiError, attempt: int) -> float:
+        # Only a real Retry-After header counts; the hint's header-less
+        # throttling default (60s) would ignore the caller's cap.
+        if err.retry_after_header is not None and err.retry.retry_after_ms is not None:
+            return min(self._retry_backoff_cap, err.retry.retry_after_ms / 1000)
+        backoff = min(self._retry_backoff_cap, self._retry_backoff_base * 2**attempt)
+        return backoff * random.uniform(0.5, 1.0)
+
+    async def _request_once(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: bytes | None,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        files: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        raw_response: bool,
+        snake_case: bool,
     ) -> Any:
-        merged_headers = {**self._auth_headers, **(headers or {})}
-
         resp = await self._http.request(
             method,
-            self._url(path),
-            json=json,
+            _parse_url(self._url(path)),
+            content=content,
             params=params,
             data=data,
             files=files,
-            headers=merged_headers,
+            headers=self._merge_auth(headers, json_body=content is not None),
         )
 
         if raw_response:
@@ -104,7 +231,7 @@ class WhatsAppClient:
 
         body: dict[str, Any] = {}
         if resp.content:
-            body = resp.json()
+            body = fastjson.loads(resp.content)
 
         if resp.status_code >= 400:
             raise GraphApiError.from_response(
@@ -113,10 +240,16 @@ class WhatsAppClient:
                 retry_after_header=resp.headers.get("retry-after"),
             )
 
-        return to_snake_deep(body)
+        return to_snake_deep(body) if snake_case else body
 
-    async def get(self, path: str, *, params: dict[str, Any] | None = None) -> Any:
-        return await self.request("GET", path, params=params)
+    async def get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        snake_case: bool = True,
+    ) -> Any:
+        return await self.request("GET", path, params=params, snake_case=snake_case)
 
     async def post(
         self,
@@ -125,11 +258,20 @@ class WhatsAppClient:
         json: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
+        snake_case: bool = True,
     ) -> Any:
-        return await self.request("POST", path, json=json, data=data, files=files)
+        return await self.request(
+            "POST", path, json=json, data=data, files=files, snake_case=snake_case
+        )
 
-    async def delete(self, path: str, *, params: dict[str, Any] | None = None) -> Any:
-        return await self.request("DELETE", path, params=params)
+    async def delete(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        snake_case: bool = True,
+    ) -> Any:
+        return await self.request("DELETE", path, params=params, snake_case=snake_case)
 
     async def fetch_raw(
         self, url: str, *, headers: dict[str, str] | None = None
@@ -141,37 +283,92 @@ class WhatsAppClient:
         self, url: str, *, headers: dict[str, str] | None = None
     ) -> httpx.Response:
         """Fetch a URL WITH auth headers attached."""
-        merged = {**self._auth_headers, **(headers or {})}
-        return await self._http.get(url, headers=merged)
+        return await self._http.get(url, headers=self._merge_auth(headers))
 
     # ── lazy resource accessors (cached) ─────────────────────────
+    # Settable (and deletable, which resets to lazy creation) so tests can
+    # swap a resource, e.g. with ``unittest.mock.patch.object``.
+
+    @property
+    def validate_responses(self) -> bool:
+        return self._validate_responses
 
-    @cached_property
+    @property
     def messages(self) -> MessagesResource:
-        from .resources.messages.resource import MessagesResource as _Cls
+        if self._messages is None:
+            from .resources.messages.resource import MessagesResource as _Cls
+
+            self._messages = _Cls(self)
+        return self._messages
+
+    @messages.setter
+    def messages(self, value: MessagesResource) -> None:
+        self._messages = value
 
-        return _Cls(self)
+    @messages.deleter
+    def messages(self) -> None:
+        self._messages = None
 
-    @cached_property
+    @property
     def media(self) -> MediaResource:
-        from .resources.media import MediaResource as _Cls
+        if self._media is None:
+            from .resources.media import MediaResource as _Cls
+
+            self._media = _Cls(self)
+        return self._media
 
-        return _Cls(self)
+    @media.setter
+    def media(self, value: MediaResource) -> None:
+        self._media = value
 
-    @cached_property
+    @media.deleter
+    def media(self) -> None:
+        self._media = None
+
+    @property
     def templates(self) -> TemplatesResource:
-        from .resources.templates.resource import TemplatesResource as _Cls
+        if self._templates is None:
+            from .resources.templates.resource import TemplatesResource as _Cls
+
+            self._templates = _Cls(self)
+        return self._templates
 
-        return _Cls(self)
+    @templates.setter
+    def templates(self, value: TemplatesResource) -> None:
+        self._templates = value
 
-    @cached_property
+    @templates.deleter
+    def templates(self) -> None:
+        self._templates = None
+
+    @property
     def phone_numbers(self) -> PhoneNumbersResource:
-        from .resources.phone_numbers import PhoneNumbersResource as _Cls
+        if self._phone_numbers is None:
+            from .resources.phone_numbers import PhoneNumbersResource as _Cls
 
-        return _Cls(self)
+            self._phone_numbers = _Cls(self)
+        return self._phone_numbers
 
-    @cached_property
+    @phone_numbers.setter
+    def phone_numbers(self, value: PhoneNumbersResource) -> None:
+        self._phone_numbers = value
+
+    @phone_numbers.deleter
+    def phone_numbers(self) -> None:
+        self._phone_numbers = None
+
+    @property
     def flows(self) -> FlowsResource:
-        from .resources.flows import FlowsResource as _Cls
+        if self._flows is None:
+            from .resources.flows import FlowsResource as _Cls
+
+            self._flows = _Cls(self)
+        return self._flows
+
+    @flows.setter
+    def flows(self, value: FlowsResource) -> None:
+        self._flows = value
 
-        return _Cls(self)
+    @flows.deleter
+    def flows(self) -> None:
+        self._flows = None
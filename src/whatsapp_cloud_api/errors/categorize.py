@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Literal
 
 ErrorCategory = Literal[
@@ -77,9 +78,12 @@ _CODE_TO_CATEGORY: dict[int, ErrorCategory] = {
 }
 
 
+@lru_cache(maxsize=512)
 def categorize_error(code: int | None, http_status: int | None = None) -> ErrorCategory:
-    if code is not None and code in _CODE_TO_CATEGORY:
-        return _CODE_TO_CATEGORY[code]
+    if code is not None:
+        category = _CODE_TO_CATEGORY.get(code)
+        if category is not None:
+            return category
     if http_status is not None and http_status >= 500:
         return "server"
     return "unknown"
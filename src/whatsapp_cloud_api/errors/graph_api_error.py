@@ -17,6 +17,7 @@ class GraphApiError(Exception):
         "http_status",
         "raw",
         "retry",
+        "retry_after_header",
         "type",
     )
 
@@ -43,6 +44,7 @@ class GraphApiError(Exception):
         self.fbtrace_id = fbtrace_id
         self.error_data = error_data
         self.raw = raw
+        self.retry_after_header = retry_after_header
 
         self.category: ErrorCategory = categorize_error(code, http_status)
         self.retry: RetryHint = get_retry_hint(self.category, retry_after_header)
@@ -95,15 +97,16 @@ class GraphApiError(Exception):
                 raw=body,
             )
 
+        get = err.get
         return cls(
-            message=err.get("message", "Unknown Graph API error"),
+            message=get("message", "Unknown Graph API error"),
             http_status=http_status,
-            code=err.get("code"),
-            type_=err.get("type", ""),
-            details=err.get("error_user_msg") or err.get("details"),
-            error_subcode=err.get("error_subcode"),
-            fbtrace_id=err.get("fbtrace_id"),
-            error_data=err.get("error_data"),
+            code=get("code"),
+            type_=get("type", ""),
+            details=get("error_user_msg") or get("details"),
+            error_subcode=get("error_subcode"),
+            fbtrace_id=get("fbtrace_id"),
+            error_data=get("error_data"),
             retry_after_header=retry_after_header,
             raw=body,
         )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 from .categorize import ErrorCategory
@@ -40,18 +41,39 @@ _CATEGORY_RETRY: dict[ErrorCategory, RetryAction] = {
 }
 
 
+_DEFAULT_THROTTLE_MS = 60_000  # default 60s
+
+# Shared frozen hints for the header-less path, built once at import.
+_STATIC_HINTS: dict[ErrorCategory, RetryHint] = {
+    category: RetryHint(
+        action=action,
+        retry_after_ms=_DEFAULT_THROTTLE_MS if action == "retry_after" else None,
+    )
+    for category, action in _CATEGORY_RETRY.items()
+}
+
+
+def _parse_retry_after_ms(retry_after_header: str) -> int | None:
+    # Delay-seconds are almost always a plain integer; skip the float parse.
+    if retry_after_header.isdecimal():
+        return int(retry_after_header) * 1000
+    with contextlib.suppress(ValueError, TypeError):
+        return int(float(retry_after_header) * 1000)
+    return None
+
+
+# Hints are immutable and Retry-After values repeat, so share one per input.
+@lru_cache(maxsize=256)
 def get_retry_hint(
     category: ErrorCategory,
     retry_after_header: str | None = None,
 ) -> RetryHint:
-    action = _CATEGORY_RETRY.get(category, "retry")
-
-    retry_after_ms: int | None = None
-    if retry_after_header is not None:
-        with contextlib.suppress(ValueError, TypeError):
-            retry_after_ms = int(float(retry_after_header) * 1000)
+    base = _STATIC_HINTS.get(category) or _STATIC_HINTS["unknown"]
+    if retry_after_header is None:
+        return base
 
-    if action == "retry_after" and retry_after_ms is None:
-        retry_after_ms = 60_000  # default 60s
+    retry_after_ms = _parse_retry_after_ms(retry_after_header)
+    if retry_after_ms is None:
+        return base
 
-    return RetryHint(action=action, retry_after_ms=retry_after_ms)
+    return RetryHint(action=base.action, retry_after_ms=retry_after_ms)
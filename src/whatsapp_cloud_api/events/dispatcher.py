@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from ..types import NormalizedWebhook, WebhookMessage
+from ..types import (
+    MessageStatusUpdate,
+    NormalizedWebhook,
+    WebhookMessage,
+    WebhookMessageContext,
+)
+from ..utils import fastjson
 from .events import (
     AudioReceived,
     ButtonReply,
@@ -20,6 +27,7 @@ from .events import (
     MessageSent,
     OrderReceived,
     ReactionReceived,
+    StatusEvent,
     StickerReceived,
     TextReceived,
     UnknownMessageReceived,
@@ -31,118 +39,194 @@ if TYPE_CHECKING:
     from pyventus.events import EventEmitter
 
 
-def _base_kwargs(msg: WebhookMessage, phone_number_id: str | None) -> dict[str, Any]:
-    ctx = None
-    if msg.context:
-        ctx = msg.context.model_dump(exclude_none=True)
+def _context_dict(ctx: WebhookMessageContext) -> dict[str, Any]:
+    """Read the context fields directly instead of a full ``model_dump``."""
+    out: dict[str, Any] = {}
+    if ctx.id is not None:
+        out["id"] = ctx.id
+    if ctx.from_ is not None:
+        out["from_"] = ctx.from_
+    if ctx.referred_product is not None:
+        out["referred_product"] = ctx.referred_product
+    return out
+
+
+# ── Per-type handlers ────────────────────────────────────────────────
+
+
+def _handle_text(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    text = msg.text or {}
+    return TextReceived(**base, body=text.get("body", ""))
+
+
+def _handle_image(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    img = msg.image or {}
+    return ImageReceived(
+        **base,
+        image_id=img.get("id", ""),
+        mime_type=img.get("mime_type", ""),
+        sha256=img.get("sha256", ""),
+        caption=img.get("caption"),
+    )
+
+
+def _handle_video(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    vid = msg.video or {}
+    return VideoReceived(
+        **base,
+        video_id=vid.get("id", ""),
+        mime_type=vid.get("mime_type", ""),
+        sha256=vid.get("sha256", ""),
+        caption=vid.get("caption"),
+    )
+
+
+def _handle_audio(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    aud = msg.audio or {}
+    return AudioReceived(
+        **base,
+        audio_id=aud.get("id", ""),
+        mime_type=aud.get("mime_type", ""),
+        sha256=aud.get("sha256", ""),
+        voice=aud.get("voice", False),
+    )
+
+
+def _handle_document(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    doc = msg.document or {}
+    return DocumentReceived(
+        **base,
+        document_id=doc.get("id", ""),
+        mime_type=doc.get("mime_type", ""),
+        sha256=doc.get("sha256", ""),
+        filename=doc.get("filename"),
+        caption=doc.get("caption"),
+    )
+
+
+def _handle_sticker(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    stk = msg.sticker or {}
+    return StickerReceived(
+        **base,
+        sticker_id=stk.get("id", ""),
+        mime_type=stk.get("mime_type", ""),
+        animated=stk.get("animated", False),
+    )
+
+
+def _handle_location(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    loc = msg.location or {}
+    return LocationReceived(
+        **base,
+        latitude=loc.get("latitude", 0.0),
+        longitude=loc.get("longitude", 0.0),
+        name=loc.get("name"),
+        address=loc.get("address"),
+    )
+
+
+def _handle_contacts(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    return ContactsReceived(**base, contacts=msg.contacts or [])
+
+
+def _handle_reaction(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    rxn = msg.reaction or {}
+    return ReactionReceived(
+        **base,
+        emoji=rxn.get("emoji"),
+        reacted_message_id=rxn.get("message_id", ""),
+    )
+
+
+def _handle_order(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
+    order = msg.order or {}
+    return OrderReceived(
+        **base,
+        catalog_id=order.get("catalog_id", ""),
+        product_items=order.get("product_items", []),
+        order_text=order.get("order_text"),
+    )
+
 
-    return {
+def _map_message(msg: WebhookMessage, phone_number_id: str | None) -> WhatsAppEvent:
+    """Convert a single WebhookMessage into a typed event."""
+    ctx = msg.context
+    base = {
         "phone_number_id": phone_number_id,
         "message_id": msg.id,
         "timestamp": msg.timestamp,
         "from_number": msg.from_ or "",
-        "context": ctx or None,
+        "context": (_context_dict(ctx) or None) if ctx is not None else None,
     }
 
+    handler = _HANDLERS.get(msg.type)
+    if handler is not None:
+        return handler(msg, base)
 
-def _map_message(msg: WebhookMessage, phone_number_id: str | None) -> WhatsAppEvent:
-    """Convert a single WebhookMessage into a typed event."""
-    base = _base_kwargs(msg, phone_number_id)
-
-    match msg.type:
-        case "text":
-            text = msg.text or {}
-            return TextReceived(**base, body=text.get("body", ""))
-
-        case "image":
-            img = msg.image or {}
-            return ImageReceived(
-                **base,
-                image_id=img.get("id", ""),
-                mime_type=img.get("mime_type", ""),
-                sha256=img.get("sha256", ""),
-                caption=img.get("caption"),
-            )
-
-        case "video":
-            vid = msg.video or {}
-            return VideoReceived(
-                **base,
-                video_id=vid.get("id", ""),
-                mime_type=vid.get("mime_type", ""),
-                sha256=vid.get("sha256", ""),
-                caption=vid.get("caption"),
-            )
-
-        case "audio":
-            aud = msg.audio or {}
-            return AudioReceived(
-                **base,
-                audio_id=aud.get("id", ""),
-                mime_type=aud.get("mime_type", ""),
-                sha256=aud.get("sha256", ""),
-                voice=aud.get("voice", False),
-            )
-
-        case "document":
-            doc = msg.document or {}
-            return DocumentReceived(
-                **base,
-                document_id=doc.get("id", ""),
-                mime_type=doc.get("mime_type", ""),
-                sha256=doc.get("sha256", ""),
-                filename=doc.get("filename"),
-                caption=doc.get("caption"),
-            )
-
-        case "sticker":
-            stk = msg.sticker or {}
-            return StickerReceived(
-                **base,
-                sticker_id=stk.get("id", ""),
-                mime_type=stk.get("mime_type", ""),
-                animated=stk.get("animated", False),
-            )
-
-        case "location":
-            loc = msg.location or {}
-            return LocationReceived(
-                **base,
-                latitude=loc.get("latitude", 0.0),
-                longitude=loc.get("longitude", 0.0),
-                name=loc.get("name"),
-                address=loc.get("address"),
-            )
-
-        case "contacts":
-            return ContactsReceived(**base, contacts=msg.contacts or [])
-
-        case "reaction":
-            rxn = msg.reaction or {}
-            return ReactionReceived(
-                **base,
-                emoji=rxn.get("emoji"),
-                reacted_message_id=rxn.get("message_id", ""),
-            )
-
-        case "interactive":
-            return _map_interactive(msg, base)
-
-        case "order":
-            order = msg.order or {}
-            return OrderReceived(
-                **base,
-                catalog_id=order.get("catalog_id", ""),
-                product_items=order.get("product_items", []),
-                order_text=order.get("order_text"),
-            )
-
-        case _:
-            return UnknownMessageReceived(
-                **base,
-                raw_type=msg.type,
-                raw_data=msg.model_dump(exclude_none=True),
-            )
+    return UnknownMessageReceived(
+        **base,
+        raw_type=msg.type,
+        raw_data=_raw_message_dict(msg, base["context"]),
+    )
+
+
+def _raw_message_dict(msg: WebhookMessage, context: dict[str, Any] | None) -> dict[str, Any]:
+    """Shallow copy of the message's non-None fields, including unknown payload keys.
+
+    Field values are already plain dicts/lists, so a recursive ``model_dump``
+    is unnecessary; only ``context`` is a model, and it was converted for ``base``.
+    """
+    raw = {k: v for k, v in msg if v is not None}
+    if "context" in raw:
+        raw["context"] = context or {}
+    return raw
+
+
+def _parse_response_json(value: Any) -> dict[str, Any]:
+    """Return ``response_json`` as a dict, decoding it only when it is a string."""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, (str, bytes)):
+        try:
+            parsed = fastjson.loads(value)
+        except fastjson.JSONDecodeError:
+            return {}
+        if isinstance(parsed, dict):
+            return parsed
+    return {}
+
+
+def _handle_button_reply(reply: dict[str, Any], base: dict[str, Any]) -> WhatsAppEvent:
+    return ButtonReply(
+        **base,
+        button_id=reply.get("id", ""),
+        button_title=reply.get("title", ""),
+    )
+
+
+def _handle_list_reply(reply: dict[str, Any], base: dict[str, Any]) -> WhatsAppEvent:
+    return ListReply(
+        **base,
+        list_id=reply.get("id", ""),
+        list_title=reply.get("title", ""),
+        list_description=reply.get("description"),
+    )
+
+
+def _handle_nfm_reply(reply: dict[str, Any], base: dict[str, Any]) -> WhatsAppEvent:
+    return FlowResponse(
+        **base,
+        response_json=_parse_response_json(reply.get("response_json")),
+        flow_token=reply.get("flow_token"),
+    )
+
+
+# Keyed by interactive["type"]; each handler gets interactive[<type>].
+_INTERACTIVE_HANDLERS: dict[str, Callable[[dict[str, Any], dict[str, Any]], WhatsAppEvent]] = {
+    "button_reply": _handle_button_reply,
+    "list_reply": _handle_list_reply,
+    "nfm_reply": _handle_nfm_reply,
+}
 
 
 def _map_interactive(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent:
@@ -150,38 +234,9 @@ def _map_interactive(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent
     interactive = msg.interactive or {}
     itype = interactive.get("type", "")
 
-    if itype == "button_reply":
-        reply = interactive.get("button_reply", {})
-        return ButtonReply(
-            **base,
-            button_id=reply.get("id", ""),
-            button_title=reply.get("title", ""),
-        )
-
-    if itype == "list_reply":
-        reply = interactive.get("list_reply", {})
-        return ListReply(
-            **base,
-            list_id=reply.get("id", ""),
-            list_title=reply.get("title", ""),
-            list_description=reply.get("description"),
-        )
-
-    if itype == "nfm_reply":
-        reply = interactive.get("nfm_reply", {})
-        response_json = reply.get("response_json", {})
-        if isinstance(response_json, str):
-            import json
-
-            try:
-                response_json = json.loads(response_json)
-            except (json.JSONDecodeError, TypeError):
-                response_json = {}
-        return FlowResponse(
-            **base,
-            response_json=response_json,
-            flow_token=reply.get("flow_token"),
-        )
+    handler = _INTERACTIVE_HANDLERS.get(itype)
+    if handler is not None:
+        return handler(interactive.get(itype, {}), base)
 
     return UnknownMessageReceived(
         **base,
@@ -190,9 +245,59 @@ def _map_interactive(msg: WebhookMessage, base: dict[str, Any]) -> WhatsAppEvent
     )
 
 
+_HANDLERS: dict[str, Callable[[WebhookMessage, dict[str, Any]], WhatsAppEvent]] = {
+    "text": _handle_text,
+    "image": _handle_image,
+    "video": _handle_video,
+    "audio": _handle_audio,
+    "document": _handle_document,
+    "sticker": _handle_sticker,
+    "location": _handle_location,
+    "contacts": _handle_contacts,
+    "reaction": _handle_reaction,
+    "interactive": _map_interactive,
+    "order": _handle_order,
+}
+
+
+_STATUS_EVENTS: dict[str, type[StatusEvent]] = {
+    "sent": MessageSent,
+    "delivered": MessageDelivered,
+    "read": MessageRead,
+}
+
+
+def _map_status(status: MessageStatusUpdate, phone_number_id: str | None) -> StatusEvent:
+    """Convert a status update into a typed event (unknown statuses map to sent)."""
+    if status.status == "failed":
+        return MessageFailed(
+            phone_number_id=phone_number_id,
+            message_id=status.id,
+            timestamp=status.timestamp,
+            recipient_id=status.recipient_id or "",
+            conversation=status.conversation,
+            pricing=status.pricing,
+            errors=status.errors or [],
+        )
+
+    cls = _STATUS_EVENTS.get(status.status, MessageSent)
+    return cls(
+        phone_number_id=phone_number_id,
+        message_id=status.id,
+        timestamp=status.timestamp,
+        recipient_id=status.recipient_id or "",
+        conversation=status.conversation,
+        pricing=status.pricing,
+    )
+
+
 def dispatch_webhook(webhook: NormalizedWebhook, emitter: EventEmitter) -> None:
     """Dispatch all events from a normalized webhook payload.
 
+    All events are mapped before anything is emitted, messages first and then
+    statuses. If the emitter class defines ``emit_many(events)``, the whole
+    batch is handed over in one call; otherwise ``emit`` is called per event.
+
     Args:
         webhook: The normalized webhook payload from ``normalize_webhook()``.
         emitter: A pyventus ``EventEmitter`` instance (e.g. ``AsyncIOEventEmitter()``
@@ -200,30 +305,16 @@ def dispatch_webhook(webhook: NormalizedWebhook, emitter: EventEmitter) -> None:
     """
     pid = webhook.phone_number_id
 
-    # Messages
-    for msg in webhook.messages:
-        event = _map_message(msg, pid)
-        emitter.emit(event)
-
-    # Statuses
-    for status in webhook.statuses:
-        base = {
-            "phone_number_id": pid,
-            "message_id": status.id,
-            "timestamp": status.timestamp,
-            "recipient_id": status.recipient_id or "",
-            "conversation": status.conversation,
-            "pricing": status.pricing,
-        }
-
-        match status.status:
-            case "sent":
-                emitter.emit(MessageSent(**base))
-            case "delivered":
-                emitter.emit(MessageDelivered(**base))
-            case "read":
-                emitter.emit(MessageRead(**base))
-            case "failed":
-                emitter.emit(MessageFailed(**base, errors=status.errors or []))
-            case _:
-                emitter.emit(MessageSent(**base))
+    events: list[WhatsAppEvent] = [_map_message(msg, pid) for msg in webhook.messages]
+    events.extend(_map_status(status, pid) for status in webhook.statuses)
+    if not events:
+        return
+
+    # Looked up on the class so mocks and plain emitters fall back to ``emit``.
+    if getattr(type(emitter), "emit_many", None) is not None:
+        emitter.emit_many(events)  # type: ignore[attr-defined]
+        return
+
+    emit = emitter.emit
+    for event in events:
+        emit(event)
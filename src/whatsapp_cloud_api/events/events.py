@@ -8,7 +8,7 @@ from typing import Any
 # ── Base ─────────────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class WhatsAppEvent:
     """Base for all WhatsApp webhook events."""
 
@@ -18,7 +18,7 @@ class WhatsAppEvent:
 # ── Message events ───────────────────────────────────────────────────
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class MessageEvent(WhatsAppEvent):
     """Base for all inbound message events."""
 
@@ -28,13 +28,13 @@ class MessageEvent(WhatsAppEvent):
     context: dict[str, Any] | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class TextReceived(MessageEvent):
     body: str = ""
     preview_url: bool = False
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class ImageReceived(MessageEvent):
     image_id: str = ""
     mime_type: str = ""
@@ -42,7 +42,7 @@ class ImageReceived(MessageEvent):
     caption: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class VideoReceived(MessageEvent):
     video_id: str = ""
     mime_type: str = ""
@@ -50,7 +50,7 @@ class VideoReceived(MessageEvent):
     caption: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class AudioReceived(MessageEvent):
     audio_id: str = ""
     mime_type: str = ""
@@ -58,7 +58,7 @@ class AudioReceived(MessageEvent):
     voice: bool = False
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class DocumentReceived(MessageEvent):
     document_id: str = ""
     mime_type: str = ""
@@ -67,14 +67,14 @@ class DocumentReceived(MessageEvent):
     caption: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class StickerReceived(MessageEvent):
     sticker_id: str = ""
     mime_type: str = ""
     animated: bool = False
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class LocationReceived(MessageEvent):
     latitude: float = 0.0
     longitude: float = 0.0
@@ -82,12 +82,12 @@ class LocationReceived(MessageEvent):
     address: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class ContactsReceived(MessageEvent):
     contacts: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class ReactionReceived(MessageEvent):
     emoji: str | None = None
     reacted_message_id: str = ""
@@ -96,20 +96,20 @@ class ReactionReceived(MessageEvent):
 # ── Interactive reply events ─────────────────────────────────────────
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class ButtonReply(MessageEvent):
     button_id: str = ""
     button_title: str = ""
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class ListReply(MessageEvent):
     list_id: str = ""
     list_title: str = ""
     list_description: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class FlowResponse(MessageEvent):
     response_json: dict[str, Any] = field(default_factory=dict)
     flow_token: str | None = None
@@ -118,7 +118,7 @@ class FlowResponse(MessageEvent):
 # ── Order ────────────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class OrderReceived(MessageEvent):
     catalog_id: str = ""
     product_items: list[dict[str, Any]] = field(default_factory=list)
@@ -128,7 +128,7 @@ class OrderReceived(MessageEvent):
 # ── Status events ────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class StatusEvent(WhatsAppEvent):
     """Base for message status update events."""
 
@@ -139,22 +139,22 @@ class StatusEvent(WhatsAppEvent):
     pricing: dict[str, Any] | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class MessageSent(StatusEvent):
     pass
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class MessageDelivered(StatusEvent):
     pass
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class MessageRead(StatusEvent):
     pass
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class MessageFailed(StatusEvent):
     errors: list[dict[str, Any]] = field(default_factory=list)
 
@@ -162,7 +162,7 @@ class MessageFailed(StatusEvent):
 # ── System / catch-all ───────────────────────────────────────────────
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, match_args=False)
 class UnknownMessageReceived(MessageEvent):
     """Fired for any message type not explicitly mapped."""
 
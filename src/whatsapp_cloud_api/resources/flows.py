@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel
 
+from ..utils import fastjson
+
 if TYPE_CHECKING:
     from ..client import WhatsAppClient
 
@@ -82,16 +84,14 @@ class FlowsResource:
         self._deploy_hashes: dict[str, str] = {}
 
     async def create(self, input: CreateFlowInput) -> dict[str, Any]:
-        import json as json_mod
-
         data: dict[str, Any] = {
             "name": input.name,
-            "categories": json_mod.dumps(input.categories or ["OTHER"]),
+            "categories": fastjson.dumps(input.categories or ["OTHER"]).decode(),
         }
         files = {
             "flow_json": (
                 "flow.json",
-                json_mod.dumps(input.flow_json).encode(),
+                fastjson.dumps(input.flow_json),
                 "application/json",
             ),
         }
@@ -103,10 +103,8 @@ class FlowsResource:
         return resp
 
     async def update_asset(self, input: UpdateFlowAssetInput) -> dict[str, Any]:
-        import json as json_mod
-
         if input.json_data:
-            file_bytes = json_mod.dumps(input.json_data).encode()
+            file_bytes = fastjson.dumps(input.json_data)
         elif input.file:
             file_bytes = input.file
         else:
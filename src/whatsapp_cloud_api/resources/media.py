@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from io import IOBase
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import urlsplit
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..types import MediaMetadata, MediaUploadResponse
 
@@ -13,30 +16,53 @@ if TYPE_CHECKING:
 
 
 class MediaUploadInput(BaseModel):
+    """Upload input. ``file`` may be bytes, a ``Path`` or a binary file object.
+
+    Paths and file objects are streamed by httpx in chunks rather than read
+    into memory first. A file object passed in is left open for the caller.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     phone_number_id: str
     type: Literal["image", "video", "audio", "document", "sticker"]
-    file: bytes
+    file: bytes | Path | IOBase
     filename: str = "file"
     mime_type: str = "application/octet-stream"
     messaging_product: str = "whatsapp"
 
 
 class MediaResource:
-    __slots__ = ("_client",)
+    __slots__ = ("_auth_hosts", "_client")
 
     def __init__(self, client: WhatsAppClient) -> None:
         self._client = client
+        # Hosts that answered 401/403 unauthenticated but served the file with
+        # auth; ``auth="auto"`` downloads from them skip the doomed first try.
+        self._auth_hosts: set[str] = set()
 
     async def upload(self, input: MediaUploadInput) -> MediaUploadResponse:
-        resp = await self._client.post(
+        if isinstance(input.file, Path):
+            with input.file.open("rb") as fh:
+                resp = await self._post_upload(input, fh)
+        else:
+            resp = await self._post_upload(input, input.file)
+        if not self._client.validate_responses:
+            return MediaUploadResponse.model_construct(**resp)
+        return MediaUploadResponse.model_validate(resp)
+
+    async def _post_upload(self, input: MediaUploadInput, file: Any) -> dict[str, Any]:
+        return await self._client.post(
             f"{input.phone_number_id}/media",
             data={"messaging_product": input.messaging_product, "type": input.mime_type},
-            files={"file": (input.filename, input.file, input.mime_type)},
+            files={"file": (input.filename, file, input.mime_type)},
+            snake_case=False,
         )
-        return MediaUploadResponse.model_validate(resp)
 
     async def get(self, media_id: str) -> MediaMetadata:
-        resp = await self._client.get(media_id)
+        resp = await self._client.get(media_id, snake_case=False)
+        if not self._client.validate_responses:
+            return MediaMetadata.model_construct(**resp)
         return MediaMetadata.model_validate(resp)
 
     async def delete(self, media_id: str) -> dict[str, Any]:
@@ -55,6 +81,8 @@ class MediaResource:
             media_id: The media ID to download.
             auth: Authentication mode for the CDN fetch.
                 - "auto" (default): Try without auth first, retry with auth on 401/403.
+                  Hosts that needed auth are remembered per resource and fetched
+                  with auth directly next time.
                 - "never": Never send auth headers (public CDN downloads).
                 - "always": Always send auth headers.
             use_auth: Deprecated. Use ``auth="always"`` instead. Kept for
@@ -78,8 +106,16 @@ class MediaResource:
             return resp.content
 
         # auth == "auto": try raw, retry with auth on 401/403
+        host = urlsplit(target_url).hostname or ""
+        if host in self._auth_hosts:
+            resp = await self._client.fetch_authenticated(target_url)
+            resp.raise_for_status()
+            return resp.content
+
         resp = await self._client.fetch_raw(target_url)
         if resp.status_code in (401, 403):
             resp = await self._client.fetch_authenticated(target_url)
+            if resp.is_success:
+                self._auth_hosts.add(host)
         resp.raise_for_status()
         return resp.content
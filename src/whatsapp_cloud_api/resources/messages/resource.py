@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Literal, overload
 
-from ...types import SendMessageResponse
+from ...types import ContactInfo, MessageInfo, SendMessageResponse
+from ...utils.concurrency import DEFAULT_CONCURRENCY, gather_limited
 from .models import (
     AudioMessage,
+    BaseMessage,
     ContactsMessage,
     DocumentMessage,
     ImageMessage,
@@ -34,15 +37,33 @@ if TYPE_CHECKING:
     from ...client import WhatsAppClient
 
 
-def _to_api_key(s: str) -> str:
-    """Convert snake_case to camelCase for Meta API field names (limited scope)."""
-    parts = s.split("_")
-    return parts[0] + "".join(w.capitalize() for w in parts[1:])
+# Constant actions, shared across calls; the request body never mutates them.
+_LOCATION_REQUEST_ACTION: dict[str, Any] = {"name": "send_location"}
+_CATALOG_ACTION: dict[str, Any] = {"name": "catalog_message"}
 
 
 def _serialize(model: Any) -> dict[str, Any]:
-    """Dump pydantic model to dict with snake_case keys, excluding None values."""
-    return model.model_dump(exclude_none=True)
+    """Dump pydantic model to dict with snake_case keys, excluding None values.
+
+    Calls the model's pydantic-core serializer directly, skipping the
+    argument handling ``model_dump`` does in Python before delegating to it.
+    """
+    return model.__pydantic_serializer__.to_python(model, exclude_none=True)
+
+
+def _envelope(input: BaseMessage, msg_type: str) -> dict[str, Any]:
+    """Build the common Messages API body straight from the model's attributes."""
+    body: dict[str, Any] = {
+        "messaging_product": "whatsapp",
+        "recipient_type": input.recipient_type,
+        "to": input.to,
+        "type": msg_type,
+    }
+    if input.context_message_id:
+        body["context"] = {"message_id": input.context_message_id}
+    if input.biz_opaque_callback_data:
+        body["biz_opaque_callback_data"] = input.biz_opaque_callback_data
+    return body
 
 
 class MessagesResource:
@@ -53,56 +74,31 @@ class MessagesResource:
 
     # ── internal ─────────────────────────────────────────────────
 
-    async def _send(
-        self,
-        phone_number_id: str,
-        msg_type: str,
-        payload: dict[str, Any],
-    ) -> SendMessageResponse:
-        body: dict[str, Any] = {
-            "messaging_product": "whatsapp",
-            "recipient_type": payload.pop("recipient_type", "individual"),
-            "to": payload.pop("to"),
-            "type": msg_type,
-        }
+    def _response(self, resp: dict[str, Any]) -> SendMessageResponse:
+        if self._client.validate_responses:
+            return SendMessageResponse.model_validate(resp)
+        return SendMessageResponse.model_construct(
+            contacts=[ContactInfo.model_construct(**c) for c in resp.get("contacts", ())],
+            messages=[MessageInfo.model_construct(**m) for m in resp.get("messages", ())],
+        )
 
-        # move base fields out
-        for field in ("context_message_id", "biz_opaque_callback_data"):
-            val = payload.pop(field, None)
-            if val is not None:
-                body[field] = val
-
-        payload.pop("phone_number_id", None)
-
-        # remaining payload is the type-specific data
-        if msg_type == "text":
-            body["text"] = {
-                "body": payload.pop("body"),
-                "preview_url": payload.pop("preview_url", False),
-            }
-        elif msg_type == "reaction":
-            body["reaction"] = payload.get("reaction", payload)
-        elif msg_type == "interactive":
-            body["interactive"] = payload
-        else:
-            body[msg_type] = payload.get(msg_type, payload)
-
-        resp = await self._client.post(f"{phone_number_id}/messages", json=body)
-        return SendMessageResponse.model_validate(resp)
+    async def _post_message(
+        self, phone_number_id: str, body: dict[str, Any]
+    ) -> SendMessageResponse:
+        resp = await self._client.post(
+            f"{phone_number_id}/messages", json=body, snake_case=False
+        )
+        return self._response(resp)
 
     async def _send_interactive(
         self,
         interactive_type: str,
-        phone_number_id: str,
-        to: str,
+        input: BaseMessage,
         action: dict[str, Any],
         *,
         body_text: str | None = None,
         footer_text: str | None = None,
         header: dict[str, Any] | None = None,
-        recipient_type: str = "individual",
-        context_message_id: str | None = None,
-        biz_opaque_callback_data: str | None = None,
     ) -> SendMessageResponse:
         interactive: dict[str, Any] = {
             "type": interactive_type,
@@ -115,72 +111,112 @@ class MessagesResource:
         if header:
             interactive["header"] = header
 
-        api_body: dict[str, Any] = {
-            "messaging_product": "whatsapp",
-            "recipient_type": recipient_type,
-            "to": to,
-            "type": "interactive",
-            "interactive": interactive,
-        }
-        if context_message_id:
-            api_body["context"] = {"message_id": context_message_id}
-        if biz_opaque_callback_data:
-            api_body["biz_opaque_callback_data"] = biz_opaque_callback_data
-
-        resp = await self._client.post(f"{phone_number_id}/messages", json=api_body)
-        return SendMessageResponse.model_validate(resp)
+        body = _envelope(input, "interactive")
+        body["interactive"] = interactive
+        return await self._post_message(input.phone_number_id, body)
 
     # ── text ─────────────────────────────────────────────────────
 
     async def send_text(self, input: TextMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "text", data)
+        body = _envelope(input, "text")
+        body["text"] = {"body": input.body, "preview_url": input.preview_url}
+        return await self._post_message(input.phone_number_id, body)
+
+    @overload
+    async def send_text_bulk(
+        self,
+        inputs: Sequence[TextMessage],
+        *,
+        concurrency: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> list[SendMessageResponse]: ...
+
+    @overload
+    async def send_text_bulk(
+        self,
+        inputs: Sequence[TextMessage],
+        *,
+        concurrency: int = ...,
+        return_exceptions: bool,
+    ) -> list[SendMessageResponse | Exception]: ...
+
+    async def send_text_bulk(
+        self,
+        inputs: Sequence[TextMessage],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Send many text messages concurrently.
+
+        At most ``concurrency`` requests are in flight at once, multiplexed over
+        the client's HTTP/2 connection; the rest queue client-side. Results are
+        returned in input order. With ``return_exceptions=True`` failures are
+        returned in place. Otherwise the first failure stops any further sends,
+        waits for the in-flight ones and is raised, so the batch may have been
+        partly sent.
+        """
+        return await gather_limited(
+            self.send_text,
+            inputs,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
 
     # ── media messages ───────────────────────────────────────────
 
     async def send_image(self, input: ImageMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "image", data)
+        body = _envelope(input, "image")
+        body["image"] = _serialize(input.image)
+        return await self._post_message(input.phone_number_id, body)
 
     async def send_audio(self, input: AudioMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "audio", data)
+        body = _envelope(input, "audio")
+        body["audio"] = _serialize(input.audio)
+        return await self._post_message(input.phone_number_id, body)
 
     async def send_video(self, input: VideoMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "video", data)
+        body = _envelope(input, "video")
+        body["video"] = _serialize(input.video)
+        return await self._post_message(input.phone_number_id, body)
 
     async def send_document(self, input: DocumentMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "document", data)
+        body = _envelope(input, "document")
+        body["document"] = _serialize(input.document)
+        return await self._post_message(input.phone_number_id, body)
 
     async def send_sticker(self, input: StickerMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "sticker", data)
+        body = _envelope(input, "sticker")
+        body["sticker"] = _serialize(input.sticker)
+        return await self._post_message(input.phone_number_id, body)
 
     # ── location ─────────────────────────────────────────────────
 
     async def send_location(self, input: LocationMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "location", data)
+        body = _envelope(input, "location")
+        body["location"] = _serialize(input.location)
+        return await self._post_message(input.phone_number_id, body)
 
     # ── contacts ─────────────────────────────────────────────────
 
     async def send_contacts(self, input: ContactsMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "contacts", data)
+        body = _envelope(input, "contacts")
+        body["contacts"] = [_serialize(c) for c in input.contacts]
+        return await self._post_message(input.phone_number_id, body)
 
     # ── reaction ─────────────────────────────────────────────────
 
     async def send_reaction(self, input: ReactionMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "reaction", data)
+        body = _envelope(input, "reaction")
+        body["reaction"] = _serialize(input.reaction)
+        return await self._post_message(input.phone_number_id, body)
 
     # ── template ─────────────────────────────────────────────────
 
     async def send_template(self, input: TemplateMessage) -> SendMessageResponse:
-        data = _serialize(input)
-        return await self._send(input.phone_number_id, "template", data)
+        body = _envelope(input, "template")
+        body["template"] = _serialize(input.template)
+        return await self._post_message(input.phone_number_id, body)
 
     # ── interactive: buttons ─────────────────────────────────────
 
@@ -198,15 +234,11 @@ class MessagesResource:
         }
         return await self._send_interactive(
             "button",
-            input.phone_number_id,
-            input.to,
+            input,
             action,
             body_text=input.body_text,
             footer_text=input.footer_text,
             header=header,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: list ────────────────────────────────────────
@@ -216,26 +248,22 @@ class MessagesResource:
         if input.header:
             header = _serialize(input.header)
 
+        # One serializer call per section dumps its rows too.
         sections = []
         for s in input.sections:
-            rows = [_serialize(r) for r in s.rows]
-            sec: dict[str, Any] = {"rows": rows}
-            if s.title:
-                sec["title"] = s.title
+            sec = _serialize(s)
+            if not s.title:
+                sec.pop("title", None)
             sections.append(sec)
 
         action = {"button": input.button_text, "sections": sections}
         return await self._send_interactive(
             "list",
-            input.phone_number_id,
-            input.to,
+            input,
             action,
             body_text=input.body_text,
             footer_text=input.footer_text,
             header=header,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: product ─────────────────────────────────────
@@ -249,14 +277,10 @@ class MessagesResource:
         }
         return await self._send_interactive(
             "product",
-            input.phone_number_id,
-            input.to,
+            input,
             action,
             body_text=input.body_text,
             footer_text=input.footer_text,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: product list ────────────────────────────────
@@ -264,29 +288,18 @@ class MessagesResource:
     async def send_interactive_product_list(
         self, input: InteractiveProductListMessage
     ) -> SendMessageResponse:
-        sections = []
-        for s in input.sections:
-            sections.append(
-                {
-                    "title": s.title,
-                    "product_items": [_serialize(p) for p in s.product_items],
-                }
-            )
+        sections = [_serialize(s) for s in input.sections]
 
         action = {"catalog_id": input.catalog_id, "sections": sections}
         header = _serialize(input.header) if input.header else None
 
         return await self._send_interactive(
             "product_list",
-            input.phone_number_id,
-            input.to,
+            input,
             action,
             body_text=input.body_text,
             footer_text=input.footer_text,
             header=header,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: flow ────────────────────────────────────────
@@ -301,15 +314,11 @@ class MessagesResource:
 
         return await self._send_interactive(
             "flow",
-            input.phone_number_id,
-            input.to,
+            input,
             action,
             body_text=input.body_text,
             footer_text=input.footer_text,
             header=header,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: CTA URL ─────────────────────────────────────
@@ -327,15 +336,11 @@ class MessagesResource:
         }
         return await self._send_interactive(
             "cta_url",
-            input.phone_number_id,
-            input.to,
+            input,
             action,
             body_text=input.body_text,
             footer_text=input.footer_text,
             header=header,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: location request ────────────────────────────
@@ -343,19 +348,12 @@ class MessagesResource:
     async def send_interactive_location_request(
         self, input: InteractiveLocationRequestMessage
     ) -> SendMessageResponse:
-        action = {
-            "name": "send_location",
-        }
         return await self._send_interactive(
             "location_request_message",
-            input.phone_number_id,
-            input.to,
-            action,
+            input,
+            _LOCATION_REQUEST_ACTION,
             body_text=input.body_text,
             footer_text=input.footer_text,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: catalog ─────────────────────────────────────
@@ -363,19 +361,15 @@ class MessagesResource:
     async def send_interactive_catalog(
         self, input: InteractiveCatalogMessage
     ) -> SendMessageResponse:
-        action: dict[str, Any] = {"name": "catalog_message"}
+        action = _CATALOG_ACTION
         if input.parameters and input.parameters.thumbnail_product_retailer_id:
-            action["parameters"] = _serialize(input.parameters)
+            action = {**_CATALOG_ACTION, "parameters": _serialize(input.parameters)}
 
         return await self._send_interactive(
             "catalog_message",
-            input.phone_number_id,
-            input.to,
+            input,
             action,
             body_text=input.body_text,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: address ────────────────────────────────────
@@ -387,14 +381,10 @@ class MessagesResource:
         action = {"name": "address_message", "parameters": params}
         return await self._send_interactive(
             "address_message",
-            input.phone_number_id,
-            input.to,
+            input,
             action,
             body_text=input.body_text,
             footer_text=input.footer_text,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: call permission ─────────────────────────────
@@ -406,14 +396,10 @@ class MessagesResource:
         action = {"name": "call_permission", "parameters": params}
         return await self._send_interactive(
             "call_permission",
-            input.phone_number_id,
-            input.to,
+            input,
             action,
             body_text=input.body_text,
             footer_text=input.footer_text,
-            recipient_type=input.recipient_type,
-            context_message_id=input.context_message_id,
-            biz_opaque_callback_data=input.biz_opaque_callback_data,
         )
 
     # ── interactive: raw ─────────────────────────────────────────
@@ -440,16 +426,14 @@ class MessagesResource:
         if biz_opaque_callback_data:
             body["biz_opaque_callback_data"] = biz_opaque_callback_data
 
-        resp = await self._client.post(f"{phone_number_id}/messages", json=body)
-        return SendMessageResponse.model_validate(resp)
+        return await self._post_message(phone_number_id, body)
 
     # ── raw ──────────────────────────────────────────────────────
 
     async def send_raw(self, input: RawMessage) -> SendMessageResponse:
         """Send an arbitrary payload directly to the Messages API."""
         body = {"messaging_product": "whatsapp", **input.payload}
-        resp = await self._client.post(f"{input.phone_number_id}/messages", json=body)
-        return SendMessageResponse.model_validate(resp)
+        return await self._post_message(input.phone_number_id, body)
 
     # ── mark read ────────────────────────────────────────────────
 
@@ -460,3 +444,36 @@ class MessagesResource:
             "message_id": input.message_id,
         }
         return await self._client.post(f"{input.phone_number_id}/messages", json=body)
+
+    @overload
+    async def mark_read_many(
+        self,
+        inputs: Sequence[MarkReadInput],
+        *,
+        concurrency: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def mark_read_many(
+        self,
+        inputs: Sequence[MarkReadInput],
+        *,
+        concurrency: int = ...,
+        return_exceptions: bool,
+    ) -> list[dict[str, Any] | Exception]: ...
+
+    async def mark_read_many(
+        self,
+        inputs: Sequence[MarkReadInput],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Mark many messages as read concurrently (see ``send_text_bulk``)."""
+        return await gather_limited(
+            self.mark_read,
+            inputs,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
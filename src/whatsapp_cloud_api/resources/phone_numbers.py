@@ -47,6 +47,13 @@ class UpdateBusinessProfileInput(BaseModel):
     vertical: str | None = None
 
 
+_PROFILE_EXCLUDE = frozenset({"phone_number_id"})
+# Shared across calls: httpx copies params into its own QueryParams.
+_PROFILE_PARAMS = {
+    "fields": "about,address,description,email,profile_picture_url,websites,vertical",
+}
+
+
 # ── Sub-resources ────────────────────────────────────────────────────
 
 
@@ -59,15 +66,16 @@ class BusinessProfileSubResource:
     async def get(self, phone_number_id: str) -> BusinessProfileResponse:
         resp = await self._client.get(
             f"{phone_number_id}/whatsapp_business_profile",
-            params={
-                "fields": "about,address,description,email,"
-                "profile_picture_url,websites,vertical"
-            },
+            params=_PROFILE_PARAMS,
+            snake_case=False,
         )
         return BusinessProfileResponse.model_validate(resp)
 
     async def update(self, input: UpdateBusinessProfileInput) -> dict[str, Any]:
-        body = input.model_dump(exclude={"phone_number_id"}, exclude_none=True)
+        # pydantic-core's cached serializer, called directly (as model_dump does).
+        body = input.__pydantic_serializer__.to_python(
+            input, exclude=_PROFILE_EXCLUDE, exclude_none=True
+        )
         body["messaging_product"] = "whatsapp"
         return await self._client.post(
             f"{input.phone_number_id}/whatsapp_business_profile",
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 from ...types import TemplateCreateResponse, TemplateDeleteResponse, TemplateListResponse
+from ...utils.concurrency import DEFAULT_CONCURRENCY, gather_limited
 from .models import TemplateCreateInput, TemplateDeleteInput, TemplateListInput
 
 if TYPE_CHECKING:
@@ -57,6 +59,7 @@ class TemplatesResource:
         resp = await self._client.post(
             f"{input.business_account_id}/message_templates",
             json=body,
+            snake_case=False,
         )
         return TemplateCreateResponse.model_validate(resp)
 
@@ -68,5 +71,72 @@ class TemplatesResource:
         resp = await self._client.delete(
             f"{input.business_account_id}/message_templates",
             params=params,
+            snake_case=False,
         )
         return TemplateDeleteResponse.model_validate(resp)
+
+    @overload
+    async def create_many(
+        self,
+        inputs: Sequence[TemplateCreateInput],
+        *,
+        concurrency: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> list[TemplateCreateResponse]: ...
+
+    @overload
+    async def create_many(
+        self,
+        inputs: Sequence[TemplateCreateInput],
+        *,
+        concurrency: int = ...,
+        return_exceptions: bool,
+    ) -> list[TemplateCreateResponse | Exception]: ...
+
+    async def create_many(
+        self,
+        inputs: Sequence[TemplateCreateInput],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Create many templates concurrently (see ``MessagesResource.send_text_bulk``)."""
+        return await gather_limited(
+            self.create,
+            inputs,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    @overload
+    async def delete_many(
+        self,
+        inputs: Sequence[TemplateDeleteInput],
+        *,
+        concurrency: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> list[TemplateDeleteResponse]: ...
+
+    @overload
+    async def delete_many(
+        self,
+        inputs: Sequence[TemplateDeleteInput],
+        *,
+        concurrency: int = ...,
+        return_exceptions: bool,
+    ) -> list[TemplateDeleteResponse | Exception]: ...
+
+    async def delete_many(
+        self,
+        inputs: Sequence[TemplateDeleteInput],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Delete many templates concurrently (see ``MessagesResource.send_text_bulk``)."""
+        return await gather_limited(
+            self.delete,
+            inputs,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict
 
+from .utils import fastjson
 
+
+@lru_cache(maxsize=256)
 def _to_camel(s: str) -> str:
     parts = s.split("_")
     return parts[0] + "".join(w.capitalize() for w in parts[1:])
@@ -133,11 +137,6 @@ class WebhookMessageContext(CamelModel):
     from_: str | None = None
     referred_product: dict[str, Any] | None = None
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=_to_camel,
-    )
-
 
 class WebhookMessage(CamelModel):
     id: str
@@ -161,11 +160,8 @@ class WebhookMessage(CamelModel):
     button: dict[str, Any] | None = None
     referral: dict[str, Any] | None = None
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=_to_camel,
-        extra="allow",
-    )
+    # Inherits populate_by_name / alias_generator from CamelModel.
+    model_config = ConfigDict(extra="allow")
 
 
 class MessageStatusUpdate(CamelModel):
@@ -177,11 +173,8 @@ class MessageStatusUpdate(CamelModel):
     pricing: dict[str, Any] | None = None
     errors: list[dict[str, Any]] | None = None
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=_to_camel,
-        extra="allow",
-    )
+    # Inherits populate_by_name / alias_generator from CamelModel.
+    model_config = ConfigDict(extra="allow")
 
 
 class NormalizedWebhook(CamelModel):
@@ -193,11 +186,24 @@ class NormalizedWebhook(CamelModel):
     statuses: list[MessageStatusUpdate] = []
     raw: dict[str, list[dict[str, Any]]] = {}
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=_to_camel,
-        extra="allow",
-    )
+    # Inherits populate_by_name / alias_generator from CamelModel.
+    model_config = ConfigDict(extra="allow")
+
+    def to_bytes(self) -> bytes:
+        """Serialize to JSON bytes, e.g. for forwarding to a queue.
+
+        Same document as ``model_dump_json()`` (field names, ``None`` kept),
+        but encoded straight from the model attributes via ``fastjson``,
+        which is several times faster with orjson installed.
+        """
+        return fastjson.dumps(self, default=_model_fields)
+
+
+def _model_fields(obj: Any) -> dict[str, Any]:
+    if isinstance(obj, BaseModel):
+        extra = obj.__pydantic_extra__
+        return {**obj.__dict__, **extra} if extra else obj.__dict__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 # ── Calls ───────────────────────────────────────────────────────────
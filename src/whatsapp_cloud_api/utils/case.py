@@ -1,38 +1,57 @@
 from __future__ import annotations
 
 import re
+import sys
 from functools import lru_cache
 from typing import Any
 
-_CAMEL_RE = re.compile(r"_([a-z0-9])")
 _SNAKE_RE = re.compile(r"(?<=[a-z0-9])([A-Z])")
+_CONTAINERS = (dict, list)
 
 
-@lru_cache(maxsize=1024)
+@lru_cache(maxsize=4096)
 def to_camel(s: str) -> str:
-    return _CAMEL_RE.sub(lambda m: m.group(1).upper(), s)
-
-
-@lru_cache(maxsize=1024)
+    # "_x" becomes "X" for ASCII lowercase/digit x; any other "_" is kept.
+    if "_" not in s:
+        return s
+    head, *tail = s.split("_")
+    out = [head]
+    for part in tail:
+        first = part[:1]
+        if first.isascii() and (first.islower() or first.isdigit()):
+            out.append(first.upper() + part[1:])
+        else:
+            out.append("_" + part)
+    return sys.intern("".join(out))
+
+
+@lru_cache(maxsize=4096)
 def to_snake(s: str) -> str:
-    return _SNAKE_RE.sub(r"_\1", s).lower()
-
-
-def _is_plain_object(v: Any) -> bool:
-    return isinstance(v, dict)
+    if s.islower():  # already snake_case (or no cased characters to split on)
+        return s
+    # Interned so converted keys share identity with the same literals in code.
+    return sys.intern(_SNAKE_RE.sub(r"_\1", s).lower())
 
 
 def to_camel_deep(obj: Any) -> Any:
+    # Same shape as to_snake_deep: only containers pay for a recursive call.
+    if isinstance(obj, dict):
+        return {
+            to_camel(k): to_camel_deep(v) if isinstance(v, _CONTAINERS) else v
+            for k, v in obj.items()
+        }
     if isinstance(obj, list):
-        return [to_camel_deep(item) for item in obj]
-    if _is_plain_object(obj):
-        return {to_camel(k): to_camel_deep(v) for k, v in obj.items()}
+        return [to_camel_deep(item) if isinstance(item, _CONTAINERS) else item for item in obj]
     return obj
 
 
 def to_snake_deep(obj: Any) -> Any:
+    # Only recurse into containers; scalar values are copied without a call.
+    if isinstance(obj, dict):
+        return {
+            to_snake(k): to_snake_deep(v) if isinstance(v, _CONTAINERS) else v
+            for k, v in obj.items()
+        }
     if isinstance(obj, list):
-        return [to_snake_deep(item) for item in obj]
-    if _is_plain_object(obj):
-        return {to_snake(k): to_snake_deep(v) for k, v in obj.items()}
+        return [to_snake_deep(item) if isinstance(item, _CONTAINERS) else item for item in obj]
     return obj
@@ -0,0 +1,54 @@
+"""Bounded concurrent fan-out for the ``*_bulk`` / ``*_many`` resource helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# In flight at once: well under the default pool size (100) and Meta's default
+# per-number throughput (80 messages/s), so large batches queue client-side.
+DEFAULT_CONCURRENCY = 32
+
+
+async def gather_limited(
+    func: Callable[[T], Awaitable[Any]],
+    inputs: Sequence[T],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Await ``func(item)`` for every input, at most ``concurrency`` at a time.
+
+    Results are returned in input order. With ``return_exceptions=True`` a
+    failure is stored in place of its result. Otherwise the first failure stops
+    further calls from starting, the calls already in flight are awaited (none
+    is left running unobserved), and that failure is raised: inputs before it
+    may have been sent, later ones may not.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    results: list[Any] = [None] * len(inputs)
+    errors: list[Exception] = []
+    pending = iter(enumerate(inputs))
+
+    async def worker() -> None:
+        # Workers share one iterator, so each input is taken exactly once.
+        for i, item in pending:
+            try:
+                results[i] = await func(item)
+            except Exception as exc:
+                if not return_exceptions:
+                    errors.append(exc)
+                    return
+                results[i] = exc
+            if errors:
+                return
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(inputs)))))
+    if errors:
+        raise errors[0]
+    return results
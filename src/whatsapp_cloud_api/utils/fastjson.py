@@ -0,0 +1,53 @@
+"""JSON encode/decode with an optional orjson fast path.
+
+``orjson`` is used when installed (``speedups`` extra); otherwise the stdlib
+``json`` module is used. ``dumps`` always returns compact UTF-8 bytes and
+``loads`` accepts ``bytes`` or ``str``. ``default`` is called for objects
+neither encoder handles natively, as in both libraries. Decode errors are raised as
+``json.JSONDecodeError`` (orjson's error type subclasses it).
+
+The two paths agree on JSON-native payloads (``dict``/``list``/``str``/
+numbers/``bool``/``None``); non-``str`` dict keys are coerced by both. They
+still differ elsewhere: orjson serializes ``datetime``, ``UUID`` and
+dataclasses natively (stdlib calls ``default``), emits ``null`` for NaN and
+infinities (stdlib writes ``NaN``/``Infinity``), and rejects integers wider
+than 64 bits.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+
+    def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, default=default
+        ).encode("utf-8")
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        try:
+            return json.loads(data)
+        except UnicodeDecodeError as err:
+            # Match orjson: undecodable bytes are a decode error, not a UnicodeError.
+            doc = data.decode("utf-8", "replace")  # type: ignore[union-attr]
+            raise JSONDecodeError(str(err), doc, err.start) from err
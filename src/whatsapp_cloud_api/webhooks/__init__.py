@@ -1,4 +1,4 @@
 from .normalize import normalize_webhook
-from .verify import verify_signature
+from .verify import verify_signature, verify_signatures_batch
 
-__all__ = ["normalize_webhook", "verify_signature"]
+__all__ = ["normalize_webhook", "verify_signature", "verify_signatures_batch"]
@@ -2,24 +2,66 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
-from ..types import MessageStatusUpdate, NormalizedWebhook, WebhookMessage
+from ..types import (
+    MessageStatusUpdate,
+    NormalizedWebhook,
+    WebhookMessage,
+    WebhookMessageContext,
+)
+from ..utils import fastjson
 from ..utils.case import to_snake_deep
 
+_MESSAGE_REQUIRED = ("id", "type", "timestamp")
+_STATUS_REQUIRED = ("id", "status", "timestamp")
 
-def normalize_webhook(payload: Any) -> NormalizedWebhook:
+
+def _build_message(data: dict[str, Any], validate: bool) -> WebhookMessage:
+    if validate or not all(k in data for k in _MESSAGE_REQUIRED):
+        return WebhookMessage.model_validate(data)
+    ctx = data.get("context")
+    if ctx is not None:
+        if not isinstance(ctx, dict):
+            return WebhookMessage.model_validate(data)
+        data["context"] = WebhookMessageContext.model_construct(**ctx)
+    return WebhookMessage.model_construct(**data)
+
+
+def _build_status(data: dict[str, Any], validate: bool) -> MessageStatusUpdate:
+    if validate or not all(k in data for k in _STATUS_REQUIRED):
+        return MessageStatusUpdate.model_validate(data)
+    return MessageStatusUpdate.model_construct(**data)
+
+
+def normalize_webhook(payload: Any, *, validate: bool = True) -> NormalizedWebhook:
     """Normalize a raw Meta webhook payload into a unified structure.
 
     Flattens the deeply nested Graph API webhook format into top-level lists
     of messages, statuses, and contacts. All keys are converted to snake_case.
 
+    With ``validate=False`` messages and statuses are built with
+    ``model_construct`` when their required keys are present, skipping the
+    pydantic validation pass. Only use it for payloads from a trusted source:
+    values of the wrong type are then kept as-is instead of being rejected.
+
     Args:
-        payload: The parsed JSON body of the webhook request.
+        payload: The webhook body, either parsed or as the raw bytes/str
+            already read for signature verification. Raw bodies are decoded
+            with ``fastjson`` (orjson when installed); like any other
+            non-object payload, invalid JSON yields an empty result.
+        validate: Run full pydantic validation on messages and statuses
+            (the default). Mirrors ``WhatsAppClient(validate_responses=...)``.
 
     Returns:
         NormalizedWebhook with messages, statuses, contacts, and raw fields.
     """
+    if isinstance(payload, (bytes, bytearray, memoryview, str)):
+        try:
+            payload = fastjson.loads(payload)
+        except fastjson.JSONDecodeError:
+            return NormalizedWebhook()
     if not isinstance(payload, dict):
         return NormalizedWebhook()
 
@@ -29,7 +71,7 @@ def normalize_webhook(payload: Any) -> NormalizedWebhook:
     all_messages: list[WebhookMessage] = []
     all_statuses: list[MessageStatusUpdate] = []
     all_contacts: list[dict[str, Any]] = []
-    raw: dict[str, list[dict[str, Any]]] = {}
+    raw: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
     phone_number_id: str | None = None
     display_phone_number: str | None = None
 
@@ -40,7 +82,7 @@ def normalize_webhook(payload: Any) -> NormalizedWebhook:
             field = change.get("field", "")
 
             if field != "messages":
-                raw.setdefault(field, []).append(to_snake_deep(value))
+                raw[field].append(to_snake_deep(value))
                 continue
 
             metadata = value.get("metadata", {})
@@ -48,30 +90,33 @@ def normalize_webhook(payload: Any) -> NormalizedWebhook:
                 phone_number_id = metadata.get("phone_number_id")
                 display_phone_number = metadata.get("display_phone_number")
 
-            # Contacts
-            for c in value.get("contacts", []):
-                all_contacts.append(to_snake_deep(c))
-
-            # Messages
-            for msg in value.get("messages", []):
-                normalized = to_snake_deep(msg)
-                # Determine direction
-                if "from" in normalized:
-                    normalized.setdefault("from_", normalized.pop("from", None))
-
-                all_messages.append(WebhookMessage.model_validate(normalized))
-
-            # Statuses
-            for status in value.get("statuses", []):
-                normalized = to_snake_deep(status)
-                all_statuses.append(MessageStatusUpdate.model_validate(normalized))
-
-    return NormalizedWebhook(
+            # Each list is snake_cased in one call rather than once per item.
+            contacts = value.get("contacts")
+            if contacts:
+                all_contacts.extend(to_snake_deep(contacts))
+
+            # "from" needs no renaming: both build paths resolve the alias to from_.
+            messages = value.get("messages")
+            if messages:
+                all_messages.extend(
+                    _build_message(normalized, validate)
+                    for normalized in to_snake_deep(messages)
+                )
+
+            statuses = value.get("statuses")
+            if statuses:
+                all_statuses.extend(
+                    _build_status(normalized, validate)
+                    for normalized in to_snake_deep(statuses)
+                )
+
+    # Every field is already built from the payload; skip revalidating the lists.
+    return NormalizedWebhook.model_construct(
         object=obj,
         phone_number_id=phone_number_id,
         display_phone_number=display_phone_number,
         contacts=all_contacts,
         messages=all_messages,
         statuses=all_statuses,
-        raw=raw,
+        raw=dict(raw),
     )
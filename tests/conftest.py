@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import importlib
+import ssl
+import sys
 from typing import Any
 
 import httpx
@@ -9,6 +12,7 @@ import pytest
 import respx
 
 from whatsapp_cloud_api.client import WhatsAppClient
+from whatsapp_cloud_api.utils import fastjson
 
 
 @pytest.fixture()
@@ -26,6 +30,33 @@ def mock_client(mock_api):
     return WhatsAppClient(access_token="test-token", http_client=http)
 
 
+@pytest.fixture(params=["default", "stdlib"])
+def codec(request, monkeypatch):
+    """Yield the module as imported, and a copy reloaded without orjson."""
+    if request.param == "default":
+        yield fastjson
+        return
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    yield importlib.reload(fastjson)
+    monkeypatch.undo()
+    importlib.reload(fastjson)
+
+
+@pytest.fixture(scope="session")
+def ssl_context() -> ssl.SSLContext:
+    """Loading the CA bundle dominates client construction, so do it once."""
+    return httpx.create_ssl_context()
+
+
+@pytest.fixture()
+async def client(ssl_context):
+    """A fresh WhatsAppClient per test, sharing the session's SSL context."""
+    http = httpx.AsyncClient(http2=True, verify=ssl_context)
+    async with WhatsAppClient(access_token="tok", http_client=http) as wa:
+        yield wa
+    await http.aclose()
+
+
 @pytest.fixture()
 def send_message_response() -> dict[str, Any]:
     """Standard API response for a sent message."""
@@ -36,6 +67,26 @@ def send_message_response() -> dict[str, Any]:
     }
 
 
+def sent_body(route: respx.Route, call: int = 0) -> Any:
+    """Decode the JSON body of a request recorded on a respx route."""
+    return fastjson.loads(route.calls[call].request.content)
+
+
+class FakeEmitter:
+    """Records emitted events; a cheap stand-in for a pyventus emitter."""
+
+    def __init__(self) -> None:
+        self.events: list[Any] = []
+
+    def emit(self, event: Any) -> None:
+        self.events.append(event)
+
+
+@pytest.fixture()
+def emitter() -> FakeEmitter:
+    return FakeEmitter()
+
+
 def build_webhook_payload(
     *,
     messages: list[dict[str, Any]] | None = None,
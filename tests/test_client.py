@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import weakref
+from unittest.mock import AsyncMock, patch
+
 import httpx
 import pytest
 import respx
 
-from whatsapp_cloud_api.client import WhatsAppClient
+from whatsapp_cloud_api.client import WhatsAppClient, _parse_url
 from whatsapp_cloud_api.errors import GraphApiError
+from whatsapp_cloud_api.resources.messages.resource import MessagesResource
 
 BASE = "https://api.kapso.ai/meta/whatsapp/v24.0"
 
@@ -34,6 +38,32 @@ class TestUrl:
         client = WhatsAppClient(access_token="tok", graph_version="v22.0")
         assert client._url("path") == "https://api.kapso.ai/meta/whatsapp/v22.0/path"
 
+    def test_parsed_url_is_cached(self):
+        url = f"{BASE}/123/request_code"
+        assert _parse_url(url) is _parse_url(url)
+        assert _parse_url(url) == httpx.URL(url)
+
+
+class TestPoolLimits:
+    def test_keepalive_defaults_to_max_connections(self):
+        client = WhatsAppClient(access_token="tok")
+        pool = client._http._transport._pool
+        assert pool._max_connections == 100
+        assert pool._max_keepalive_connections == 100
+        assert pool._keepalive_expiry == 90.0
+
+    def test_custom_limits(self):
+        client = WhatsAppClient(
+            access_token="tok",
+            max_connections=1000,
+            max_keepalive_connections=50,
+            keepalive_expiry=10.0,
+        )
+        pool = client._http._transport._pool
+        assert pool._max_connections == 1000
+        assert pool._max_keepalive_connections == 50
+        assert pool._keepalive_expiry == 10.0
+
 
 class TestRequest:
     @respx.mock
@@ -46,6 +76,15 @@ class TestRequest:
         assert result == {"messaging_product": "whatsapp"}
         assert route.called
 
+    @respx.mock
+    async def test_snake_case_disabled_returns_body_as_is(self):
+        respx.get(f"{BASE}/test").mock(
+            return_value=httpx.Response(200, json={"messagingProduct": "whatsapp"})
+        )
+        async with WhatsAppClient(access_token="tok") as client:
+            result = await client.get("test", snake_case=False)
+        assert result == {"messagingProduct": "whatsapp"}
+
     @respx.mock
     async def test_error_raises_graph_api_error(self):
         respx.get(f"{BASE}/test").mock(
@@ -80,6 +119,20 @@ class TestRequest:
             await client.get("test")
         assert route.calls[0].request.headers["x-api-key"] == "my-token"
 
+    @respx.mock
+    async def test_extra_headers_merged_with_auth(self):
+        route = respx.get(f"{BASE}/test").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        async with WhatsAppClient(access_token="my-token") as client:
+            await client.request("GET", "test", headers={"X-Trace": "abc"})
+            await client.get("test")
+        first, second = (c.request.headers for c in route.calls)
+        assert first["x-api-key"] == "my-token"
+        assert first["x-trace"] == "abc"
+        assert "x-trace" not in second
+        assert client._auth_headers == {"X-API-Key": "my-token"}
+
     @respx.mock
     async def test_post_with_json(self):
         route = respx.post(f"{BASE}/123/messages").mock(
@@ -89,6 +142,21 @@ class TestRequest:
             await client.post("123/messages", json={"to": "456", "type": "text"})
         assert route.called
 
+    @respx.mock
+    async def test_json_body_preserialized(self):
+        route = respx.post(f"{BASE}/123/messages").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        async with WhatsAppClient(access_token="tok") as client:
+            await client.request(
+                "POST", "123/messages", json={"text": "héllo"}, headers={"X-Trace": "abc"}
+            )
+        req = route.calls[0].request
+        assert req.content == '{"text":"héllo"}'.encode()
+        assert req.headers["content-type"] == "application/json"
+        assert req.headers["x-api-key"] == "tok"
+        assert req.headers["x-trace"] == "abc"
+
     @respx.mock
     async def test_delete(self):
         route = respx.delete(f"{BASE}/media123").mock(
@@ -123,6 +191,117 @@ class TestRequest:
         assert result == {}
 
 
+class TestRetry:
+    @respx.mock
+    async def test_retries_transient_error(self):
+        route = respx.get(f"{BASE}/endpoint").mock(
+            side_effect=[
+                httpx.Response(500, json={"error": {"message": "Oops", "code": 2}}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+        async with WhatsAppClient(
+            access_token="tok", max_retries=2, retry_backoff_base=0
+        ) as client:
+            result = await client.get("endpoint")
+        assert result == {"ok": True}
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_honours_retry_after_header(self):
+        route = respx.get(f"{BASE}/endpoint").mock(
+            side_effect=[
+                httpx.Response(
+                    429,
+                    json={"error": {"message": "Rate limited", "code": 4}},
+                    headers={"retry-after": "0"},
+                ),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+        async with WhatsAppClient(access_token="tok", max_retries=1) as client:
+            result = await client.get("endpoint")
+        assert result == {"ok": True}
+        assert route.call_count == 2
+
+    def test_retry_after_header_is_capped(self):
+        client = WhatsAppClient(access_token="tok", retry_backoff_cap=2.0)
+        err = GraphApiError("Rate limited", http_status=429, code=4, retry_after_header="120")
+        assert client._retry_delay(err, 0) == 2.0
+
+    def test_throttle_without_header_uses_backoff(self):
+        client = WhatsAppClient(
+            access_token="tok", retry_backoff_base=0.5, retry_backoff_cap=1.0
+        )
+        err = GraphApiError("Rate limited", http_status=429, code=4)
+        assert err.retry.retry_after_ms == 60_000
+        assert client._retry_delay(err, 0) <= 0.5
+
+    @respx.mock
+    async def test_gives_up_after_max_retries(self):
+        route = respx.get(f"{BASE}/endpoint").mock(
+            return_value=httpx.Response(500, json={"error": {"message": "Oops", "code": 2}})
+        )
+        async with WhatsAppClient(
+            access_token="tok", max_retries=2, retry_backoff_base=0
+        ) as client:
+            with pytest.raises(GraphApiError):
+                await client.get("endpoint")
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_does_not_retry_fix_and_retry(self):
+        route = respx.get(f"{BASE}/endpoint").mock(
+            return_value=httpx.Response(
+                400, json={"error": {"message": "Bad param", "code": 100}}
+            )
+        )
+        async with WhatsAppClient(
+            access_token="tok", max_retries=3, retry_backoff_base=0
+        ) as client:
+            with pytest.raises(GraphApiError):
+                await client.get("endpoint")
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_does_not_retry_string_error_401(self):
+        route = respx.post(f"{BASE}/endpoint").mock(
+            return_value=httpx.Response(401, json={"error": "Invalid API key"})
+        )
+        async with WhatsAppClient(
+            access_token="tok", max_retries=3, retry_backoff_base=0
+        ) as client:
+            with pytest.raises(GraphApiError) as exc:
+                await client.post("endpoint", json={})
+        assert exc.value.retry.action == "retry"
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_does_not_retry_unmapped_4xx(self):
+        route = respx.get(f"{BASE}/endpoint").mock(
+            return_value=httpx.Response(
+                404, json={"error": {"message": "Not found", "code": 999999}}
+            )
+        )
+        async with WhatsAppClient(
+            access_token="tok", max_retries=3, retry_backoff_base=0
+        ) as client:
+            with pytest.raises(GraphApiError) as exc:
+                await client.get("endpoint")
+        assert exc.value.category == "unknown"
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_no_retry_by_default(self):
+        route = respx.get(f"{BASE}/endpoint").mock(
+            return_value=httpx.Response(500, json={"error": {"message": "Oops", "code": 2}})
+        )
+        async with WhatsAppClient(access_token="tok") as client:
+            with pytest.raises(GraphApiError):
+                await client.get("endpoint")
+        assert route.call_count == 1
+
+
 class TestAclose:
     async def test_aclose_owned_client(self):
         client = WhatsAppClient(access_token="tok")
@@ -188,3 +367,25 @@ class TestCachedProperties:
     def test_flows_returns_same_instance(self):
         client = WhatsAppClient(access_token="tok")
         assert client.flows is client.flows
+
+    def test_resources_created_lazily(self):
+        client = WhatsAppClient(access_token="tok")
+        assert client._messages is None
+        _ = client.messages
+        assert client._messages is not None
+
+    async def test_methods_can_be_patched(self):
+        client = WhatsAppClient(access_token="tok")
+        with patch.object(client, "post", AsyncMock(return_value={"ok": True})) as post:
+            assert await client.post("endpoint", json={}) == {"ok": True}
+        post.assert_awaited_once()
+        assert weakref.ref(client)() is client
+
+    def test_resources_can_be_patched(self):
+        client = WhatsAppClient(access_token="tok")
+        fake = object()
+        with patch.object(client, "messages", fake):
+            assert client.messages is fake
+        assert isinstance(client.messages, MessagesResource)
+        client.flows = fake
+        assert client.flows is fake
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import json
-
 import httpx
 import respx
 
+from tests.conftest import sent_body
 from whatsapp_cloud_api.client import WhatsAppClient
-from whatsapp_cloud_api.resources.flows import FlowsResource, _compute_flow_hash
+from whatsapp_cloud_api.resources.flows import DeployFlowInput, FlowsResource, _compute_flow_hash
 from whatsapp_cloud_api.resources.media import MediaResource
 from whatsapp_cloud_api.resources.messages.models import (
     AddressParameters,
@@ -52,7 +51,7 @@ class TestSendRaw:
                 )
             )
         assert result.messages[0].id == "wamid.test"
-        sent = json.loads(route.calls[0].request.content)
+        sent = sent_body(route)
         assert sent["messaging_product"] == "whatsapp"
         assert sent["type"] == "text"
         assert sent["text"]["body"] == "raw hello"
@@ -77,7 +76,7 @@ class TestSendInteractiveAddress:
                     parameters=AddressParameters(country="BR"),
                 )
             )
-        sent = json.loads(route.calls[0].request.content)
+        sent = sent_body(route)
         assert sent["type"] == "interactive"
         interactive = sent["interactive"]
         assert interactive["type"] == "address_message"
@@ -107,7 +106,7 @@ class TestSendInteractiveCallPermission:
                     ),
                 )
             )
-        sent = json.loads(route.calls[0].request.content)
+        sent = sent_body(route)
         assert sent["type"] == "interactive"
         interactive = sent["interactive"]
         assert interactive["type"] == "call_permission"
@@ -177,6 +176,26 @@ class TestMediaDownloadAuth:
         assert data == b"retried-bytes"
         assert cdn_route.call_count == 2
 
+    @respx.mock
+    async def test_auth_auto_remembers_auth_host(self):
+        respx.get(f"{BASE}/media123").mock(
+            return_value=httpx.Response(200, json=MEDIA_META)
+        )
+        cdn_route = respx.get(CDN_URL).mock(
+            side_effect=[
+                httpx.Response(403, content=b""),
+                httpx.Response(200, content=b"first"),
+                httpx.Response(200, content=b"second"),
+            ]
+        )
+        async with WhatsAppClient(access_token="tok") as client:
+            resource = MediaResource(client)
+            await resource.download("media123")
+            data = await resource.download("media123")
+        assert data == b"second"
+        assert cdn_route.call_count == 3
+        assert cdn_route.calls[2].request.headers.get("x-api-key") == "tok"
+
     @respx.mock
     async def test_use_auth_backwards_compat(self):
         """use_auth=True should still work (maps to auth='always')."""
@@ -212,8 +231,6 @@ class TestFlowDeployHashCaching:
     @respx.mock
     async def test_deploy_caches_hash(self):
         """Second deploy with same JSON should skip update_asset call."""
-        from whatsapp_cloud_api.resources.flows import DeployFlowInput
-
         waba = "waba123"
         flow_json = {"screens": [{"id": "s1"}]}
 
@@ -248,8 +265,6 @@ class TestFlowDeployHashCaching:
     @respx.mock
     async def test_deploy_force_upload(self):
         """force_asset_upload=True should bypass cache."""
-        from whatsapp_cloud_api.resources.flows import DeployFlowInput
-
         flow_json = {"screens": [{"id": "s1"}]}
         asset_route = respx.post(f"{BASE}/flow1/assets").mock(
             return_value=httpx.Response(200, json={"success": True})
@@ -35,6 +35,15 @@ class TestGetRetryHint:
         hint = get_retry_hint("throttling", retry_after_header="not-a-number")
         assert hint.retry_after_ms == 60_000
 
+    def test_superscript_digit_header_falls_back_to_default(self):
+        # str.isdigit() accepts "²" but int() rejects it.
+        hint = get_retry_hint("throttling", retry_after_header="²")
+        assert hint.retry_after_ms == 60_000
+
+    def test_repeated_header_returns_shared_hint(self):
+        first = get_retry_hint("throttling", retry_after_header="7")
+        assert get_retry_hint("throttling", retry_after_header="7") is first
+
     def test_non_throttling_with_retry_after_header(self):
         # retry_after_header is parsed but retry_after_ms only forced for "retry_after" action
         hint = get_retry_hint("authorization", retry_after_header="10")
@@ -54,6 +63,9 @@ class TestGetRetryHint:
         hint = get_retry_hint("unknown")
         assert hint.action == "retry"
 
+    def test_no_header_reuses_hint_instance(self):
+        assert get_retry_hint("throttling") is get_retry_hint("throttling")
+
 
 class TestRetryHintFrozen:
     def test_immutable(self):
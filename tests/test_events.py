@@ -69,6 +69,25 @@ class TestEventFrozen:
             event.phone_number_id = "should_fail"  # type: ignore[misc]
 
 
+class TestEventSlots:
+    @pytest.mark.parametrize("cls", ALL_EVENT_CLASSES, ids=lambda c: c.__name__)
+    def test_no_instance_dict(self, cls):
+        assert not hasattr(cls(), "__dict__")
+
+
+class TestEventIdentity:
+    def test_identity_equality_and_hash(self):
+        a = TextReceived(body="hi", context={"id": "wamid.0"})
+        b = TextReceived(body="hi", context={"id": "wamid.0"})
+        assert a != b
+        assert a == a
+        assert len({a, b}) == 2
+
+    def test_keyword_only_construction(self):
+        with pytest.raises(TypeError):
+            TextReceived("phone1")  # type: ignore[misc]
+
+
 class TestInheritance:
     def test_text_received_is_message_event(self):
         assert issubclass(TextReceived, MessageEvent)
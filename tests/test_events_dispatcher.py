@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from typing import Any
-from unittest.mock import MagicMock
 
 from tests.conftest import build_webhook_payload
 from whatsapp_cloud_api.events.dispatcher import _map_message, dispatch_webhook
@@ -134,6 +133,20 @@ class TestMapMessage:
         assert isinstance(event, UnknownMessageReceived)
         assert event.raw_type == "ephemeral"
 
+    def test_unknown_type_raw_data_keeps_payload(self):
+        msg = _make_msg(
+            type="ephemeral", ephemeral={"ttl": 60}, context={"id": "wamid.0"}
+        )
+        event = _map_message(msg, "phone1")
+        assert event.raw_data == {
+            "id": "wamid.1",
+            "type": "ephemeral",
+            "timestamp": "1234567890",
+            "from_": "123",
+            "context": {"id": "wamid.0"},
+            "ephemeral": {"ttl": 60},
+        }
+
 
 class TestMapInteractive:
     def test_button_reply(self):
@@ -205,6 +218,19 @@ class TestMapInteractive:
         assert isinstance(event, FlowResponse)
         assert event.response_json == {}
 
+    def test_nfm_reply_with_missing_or_non_object_json(self):
+        for response_json in (None, "[1, 2]", 42):
+            msg = _make_msg(
+                type="interactive",
+                interactive={
+                    "type": "nfm_reply",
+                    "nfm_reply": {"response_json": response_json},
+                },
+            )
+            event = _map_message(msg, "phone1")
+            assert isinstance(event, FlowResponse)
+            assert event.response_json == {}
+
     def test_unknown_interactive_type(self):
         msg = _make_msg(
             type="interactive",
@@ -214,9 +240,19 @@ class TestMapInteractive:
         assert isinstance(event, UnknownMessageReceived)
         assert event.raw_type == "interactive:custom_reply"
 
+    def test_context_drops_none_fields(self):
+        msg = _make_msg(type="text", text={"body": "Hi"}, context={"id": "wamid.0"})
+        event = _map_message(msg, "phone1")
+        assert event.context == {"id": "wamid.0"}
+
+    def test_empty_context_becomes_none(self):
+        msg = _make_msg(type="text", text={"body": "Hi"}, context={})
+        event = _map_message(msg, "phone1")
+        assert event.context is None
+
 
 class TestDispatchWebhook:
-    def test_dispatches_messages(self):
+    def test_dispatches_messages(self, emitter):
         payload = build_webhook_payload(
             messages=[
                 {
@@ -229,47 +265,41 @@ class TestDispatchWebhook:
             ]
         )
         webhook = normalize_webhook(payload)
-        emitter = MagicMock()
         dispatch_webhook(webhook, emitter)
-        assert emitter.emit.call_count == 1
-        event = emitter.emit.call_args[0][0]
+        (event,) = emitter.events
         assert isinstance(event, TextReceived)
         assert event.body == "Hi"
 
-    def test_dispatches_statuses(self):
+    def test_dispatches_statuses(self, emitter):
         payload = build_webhook_payload(
             statuses=[
                 {"id": "m1", "status": "delivered", "timestamp": "1", "recipient_id": "456"}
             ]
         )
         webhook = normalize_webhook(payload)
-        emitter = MagicMock()
         dispatch_webhook(webhook, emitter)
-        assert emitter.emit.call_count == 1
-        event = emitter.emit.call_args[0][0]
+        (event,) = emitter.events
         assert isinstance(event, MessageDelivered)
 
-    def test_status_sent(self):
+    def test_status_sent(self, emitter):
         payload = build_webhook_payload(
             statuses=[{"id": "m1", "status": "sent", "timestamp": "1", "recipient_id": "456"}]
         )
         webhook = normalize_webhook(payload)
-        emitter = MagicMock()
         dispatch_webhook(webhook, emitter)
-        event = emitter.emit.call_args[0][0]
+        (event,) = emitter.events
         assert isinstance(event, MessageSent)
 
-    def test_status_read(self):
+    def test_status_read(self, emitter):
         payload = build_webhook_payload(
             statuses=[{"id": "m1", "status": "read", "timestamp": "1", "recipient_id": "456"}]
         )
         webhook = normalize_webhook(payload)
-        emitter = MagicMock()
         dispatch_webhook(webhook, emitter)
-        event = emitter.emit.call_args[0][0]
+        (event,) = emitter.events
         assert isinstance(event, MessageRead)
 
-    def test_status_failed(self):
+    def test_status_failed(self, emitter):
         payload = build_webhook_payload(
             statuses=[
                 {
@@ -282,31 +312,28 @@ class TestDispatchWebhook:
             ]
         )
         webhook = normalize_webhook(payload)
-        emitter = MagicMock()
         dispatch_webhook(webhook, emitter)
-        event = emitter.emit.call_args[0][0]
+        (event,) = emitter.events
         assert isinstance(event, MessageFailed)
         assert len(event.errors) == 1
 
-    def test_status_unknown_defaults_to_sent(self):
+    def test_status_unknown_defaults_to_sent(self, emitter):
         payload = build_webhook_payload(
             statuses=[
                 {"id": "m1", "status": "pending", "timestamp": "1", "recipient_id": "456"}
             ]
         )
         webhook = normalize_webhook(payload)
-        emitter = MagicMock()
         dispatch_webhook(webhook, emitter)
-        event = emitter.emit.call_args[0][0]
+        (event,) = emitter.events
         assert isinstance(event, MessageSent)
 
-    def test_empty_webhook_no_emits(self):
+    def test_empty_webhook_no_emits(self, emitter):
         webhook = normalize_webhook({})
-        emitter = MagicMock()
         dispatch_webhook(webhook, emitter)
-        assert emitter.emit.call_count == 0
+        assert emitter.events == []
 
-    def test_multiple_messages_and_statuses(self):
+    def test_multiple_messages_and_statuses(self, emitter):
         payload = build_webhook_payload(
             messages=[
                 {"from": "1", "id": "m1", "timestamp": "1", "type": "text", "text": {"body": "A"}},
@@ -317,10 +344,35 @@ class TestDispatchWebhook:
             ],
         )
         webhook = normalize_webhook(payload)
-        emitter = MagicMock()
         dispatch_webhook(webhook, emitter)
-        assert emitter.emit.call_count == 3
-        events = [call[0][0] for call in emitter.emit.call_args_list]
+        events = emitter.events
+        assert len(events) == 3
         assert isinstance(events[0], TextReceived)
         assert isinstance(events[1], ImageReceived)
         assert isinstance(events[2], MessageSent)
+
+    def test_emit_many_receives_whole_batch(self):
+        class BatchEmitter:
+            def __init__(self):
+                self.batches = []
+
+            def emit(self, event):
+                raise AssertionError("emit should not be called")
+
+            def emit_many(self, events):
+                self.batches.append(list(events))
+
+        payload = build_webhook_payload(
+            messages=[
+                {"from": "1", "id": "m1", "timestamp": "1", "type": "text", "text": {"body": "A"}},
+            ],
+            statuses=[
+                {"id": "s1", "status": "read", "timestamp": "3", "recipient_id": "3"},
+            ],
+        )
+        emitter = BatchEmitter()
+        dispatch_webhook(normalize_webhook(payload), emitter)
+        assert len(emitter.batches) == 1
+        batch = emitter.batches[0]
+        assert isinstance(batch[0], TextReceived)
+        assert isinstance(batch[1], MessageRead)
@@ -17,6 +17,10 @@ from whatsapp_cloud_api.resources.messages.models import (
     TextMessage,
 )
 
+# Valid building blocks shared by tests that only vary the outer message.
+_BTN = InteractiveButton(id="1", title="OK")
+_SEC = ListSection(title="s", rows=[ListRow(id="1", title="r")])
+
 
 class TestBaseMessage:
     def test_required_fields(self):
@@ -37,15 +41,6 @@ class TestBaseMessage:
         with pytest.raises(ValidationError):
             BaseMessage(phone_number_id="123", to="456", recipient_type="broadcast")
 
-    def test_biz_opaque_callback_data_max_length(self):
-        # Exactly 512 should be fine
-        msg = BaseMessage(phone_number_id="1", to="2", biz_opaque_callback_data="a" * 512)
-        assert len(msg.biz_opaque_callback_data) == 512
-
-    def test_biz_opaque_callback_data_over_limit(self):
-        with pytest.raises(ValidationError):
-            BaseMessage(phone_number_id="1", to="2", biz_opaque_callback_data="a" * 513)
-
 
 class TestMediaUnion:
     def test_media_by_id(self):
@@ -65,25 +60,6 @@ class TestTextMessage:
         assert msg.preview_url is False
 
 
-class TestInteractiveButton:
-    def test_max_length_id(self):
-        # 256 chars should be fine
-        btn = InteractiveButton(id="a" * 256, title="OK")
-        assert len(btn.id) == 256
-
-    def test_over_max_length_id(self):
-        with pytest.raises(ValidationError):
-            InteractiveButton(id="a" * 257, title="OK")
-
-    def test_max_length_title(self):
-        btn = InteractiveButton(id="1", title="a" * 20)
-        assert len(btn.title) == 20
-
-    def test_over_max_length_title(self):
-        with pytest.raises(ValidationError):
-            InteractiveButton(id="1", title="a" * 21)
-
-
 class TestInteractiveButtonsMessage:
     def test_buttons_min_length(self):
         with pytest.raises(ValidationError):
@@ -97,23 +73,19 @@ class TestInteractiveButtonsMessage:
                 phone_number_id="1",
                 to="2",
                 body_text="text",
-                buttons=[
-                    InteractiveButton(id=str(i), title=f"B{i}") for i in range(4)
-                ],
+                buttons=[_BTN] * 4,
             )
 
     def test_buttons_valid_range(self):
-        msg = InteractiveButtonsMessage(
-            phone_number_id="1",
-            to="2",
-            body_text="Choose",
-            buttons=[
-                InteractiveButton(id="1", title="A"),
-                InteractiveButton(id="2", title="B"),
-                InteractiveButton(id="3", title="C"),
-            ],
-        )
-        assert len(msg.buttons) == 3
+        # A plain loop: the sweep needs no per-count test ids.
+        for n in (1, 2, 3):
+            msg = InteractiveButtonsMessage(
+                phone_number_id="1",
+                to="2",
+                body_text="Choose",
+                buttons=[InteractiveButton(id=str(i), title=f"B{i}") for i in range(n)],
+            )
+            assert len(msg.buttons) == n
 
     def test_body_text_max_length(self):
         with pytest.raises(ValidationError):
@@ -121,7 +93,7 @@ class TestInteractiveButtonsMessage:
                 phone_number_id="1",
                 to="2",
                 body_text="a" * 1025,
-                buttons=[InteractiveButton(id="1", title="OK")],
+                buttons=[_BTN],
             )
 
     def test_footer_text_max_length(self):
@@ -131,36 +103,10 @@ class TestInteractiveButtonsMessage:
                 to="2",
                 body_text="text",
                 footer_text="a" * 61,
-                buttons=[InteractiveButton(id="1", title="OK")],
+                buttons=[_BTN],
             )
 
 
-class TestListRow:
-    def test_max_length_id(self):
-        row = ListRow(id="a" * 200, title="t")
-        assert len(row.id) == 200
-
-    def test_over_max_length_id(self):
-        with pytest.raises(ValidationError):
-            ListRow(id="a" * 201, title="t")
-
-    def test_max_length_title(self):
-        row = ListRow(id="1", title="a" * 24)
-        assert len(row.title) == 24
-
-    def test_over_max_length_title(self):
-        with pytest.raises(ValidationError):
-            ListRow(id="1", title="a" * 25)
-
-    def test_description_max_length(self):
-        row = ListRow(id="1", title="t", description="a" * 72)
-        assert len(row.description) == 72
-
-    def test_description_over_max_length(self):
-        with pytest.raises(ValidationError):
-            ListRow(id="1", title="t", description="a" * 73)
-
-
 class TestListSection:
     def test_rows_min_length(self):
         with pytest.raises(ValidationError):
@@ -174,10 +120,11 @@ class TestListSection:
             )
 
     def test_valid_rows(self):
-        sec = ListSection(
-            title="sec", rows=[ListRow(id="1", title="Row1")]
-        )
-        assert len(sec.rows) == 1
+        for n in range(1, 11):
+            sec = ListSection(
+                title="sec", rows=[ListRow(id=str(i), title=f"R{i}") for i in range(n)]
+            )
+            assert len(sec.rows) == n
 
 
 class TestInteractiveListMessage:
@@ -198,10 +145,7 @@ class TestInteractiveListMessage:
                 to="2",
                 body_text="text",
                 button_text="Menu",
-                sections=[
-                    ListSection(title=f"S{i}", rows=[ListRow(id=str(i), title=f"R{i}")])
-                    for i in range(11)
-                ],
+                sections=[_SEC] * 11,
             )
 
     def test_body_text_max_length(self):
@@ -211,7 +155,7 @@ class TestInteractiveListMessage:
                 to="2",
                 body_text="a" * 4097,
                 button_text="Menu",
-                sections=[ListSection(title="s", rows=[ListRow(id="1", title="r")])],
+                sections=[_SEC],
             )
 
     def test_button_text_max_length(self):
@@ -221,33 +165,36 @@ class TestInteractiveListMessage:
                 to="2",
                 body_text="text",
                 button_text="a" * 21,
-                sections=[ListSection(title="s", rows=[ListRow(id="1", title="r")])],
+                sections=[_SEC],
             )
 
 
-class TestLocationPayload:
-    def test_name_max_length(self):
-        loc = LocationPayload(latitude=0.0, longitude=0.0, name="a" * 100)
-        assert len(loc.name) == 100
-
-    def test_name_over_max_length(self):
-        with pytest.raises(ValidationError):
-            LocationPayload(latitude=0.0, longitude=0.0, name="a" * 101)
-
-    def test_address_max_length(self):
-        loc = LocationPayload(latitude=0.0, longitude=0.0, address="a" * 300)
-        assert len(loc.address) == 300
-
-    def test_address_over_max_length(self):
-        with pytest.raises(ValidationError):
-            LocationPayload(latitude=0.0, longitude=0.0, address="a" * 301)
-
-
-class TestDocumentPayloadById:
-    def test_filename_max_length(self):
-        doc = DocumentPayloadById(id="1", filename="a" * 240)
-        assert len(doc.filename) == 240
-
-    def test_filename_over_max_length(self):
-        with pytest.raises(ValidationError):
-            DocumentPayloadById(id="1", filename="a" * 241)
+# ── Field length limits ─────────────────────────────────────────────
+#
+# Each row is (model, other required kwargs, field, max length). The test
+# checks that exactly ``max`` characters are accepted and ``max + 1`` rejected.
+
+_LENGTH_LIMITS = [
+    (BaseMessage, {"phone_number_id": "1", "to": "2"}, "biz_opaque_callback_data", 512),
+    (InteractiveButton, {"title": "OK"}, "id", 256),
+    (InteractiveButton, {"id": "1"}, "title", 20),
+    (ListRow, {"title": "t"}, "id", 200),
+    (ListRow, {"id": "1"}, "title", 24),
+    (ListRow, {"id": "1", "title": "t"}, "description", 72),
+    (LocationPayload, {"latitude": 0.0, "longitude": 0.0}, "name", 100),
+    (LocationPayload, {"latitude": 0.0, "longitude": 0.0}, "address", 300),
+    (DocumentPayloadById, {"id": "1"}, "filename", 240),
+]
+
+
+class TestFieldLengthLimits:
+    @pytest.mark.parametrize(
+        "model,kwargs,field,limit",
+        _LENGTH_LIMITS,
+        ids=[f"{m.__name__}.{f}" for m, _, f, _ in _LENGTH_LIMITS],
+    )
+    def test_max_length(self, model, kwargs, field, limit):
+        obj = model(**kwargs, **{field: "a" * limit})
+        assert len(getattr(obj, field)) == limit
+        with pytest.raises(ValidationError):
+            model(**kwargs, **{field: "a" * (limit + 1)})
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import json
+
 import httpx
+import pytest
 import respx
 
+from tests.conftest import sent_body
 from whatsapp_cloud_api.client import WhatsAppClient
+from whatsapp_cloud_api.errors import GraphApiError
 from whatsapp_cloud_api.resources.messages.models import (
     CatalogParameters,
     ImageMessage,
@@ -20,7 +25,7 @@ from whatsapp_cloud_api.resources.messages.models import (
     MediaByLink,
     TextMessage,
 )
-from whatsapp_cloud_api.resources.messages.resource import MessagesResource
+from whatsapp_cloud_api.resources.messages.resource import _CATALOG_ACTION, MessagesResource
 
 BASE = "https://api.kapso.ai/meta/whatsapp/v24.0"
 PHONE = "1234567890"
@@ -35,18 +40,16 @@ SEND_RESPONSE = {
 
 class TestSendText:
     @respx.mock
-    async def test_body_structure(self):
+    async def test_body_structure(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json=SEND_RESPONSE)
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            result = await resource.send_text(
-                TextMessage(phone_number_id=PHONE, to="5511999999999", body="Hello")
-            )
+        resource = MessagesResource(client)
+        result = await resource.send_text(
+            TextMessage(phone_number_id=PHONE, to="5511999999999", body="Hello")
+        )
         assert result.messages[0].id == "wamid.test"
         body = route.calls[0].request.content
-        import json
         sent = json.loads(body)
         assert sent["type"] == "text"
         assert sent["text"]["body"] == "Hello"
@@ -55,86 +58,130 @@ class TestSendText:
         assert sent["to"] == "5511999999999"
 
     @respx.mock
-    async def test_preview_url_true(self):
+    async def test_reply_context_and_callback_data(self, client):
+        route = respx.post(MSG_URL).mock(
+            return_value=httpx.Response(200, json=SEND_RESPONSE)
+        )
+        await MessagesResource(client).send_text(
+            TextMessage(
+                phone_number_id=PHONE,
+                to="5511999999999",
+                body="Hello",
+                context_message_id="wamid.0",
+                biz_opaque_callback_data="cb",
+            )
+        )
+        sent = sent_body(route)
+        assert sent == {
+            "messaging_product": "whatsapp",
+            "recipient_type": "individual",
+            "to": "5511999999999",
+            "type": "text",
+            "context": {"message_id": "wamid.0"},
+            "biz_opaque_callback_data": "cb",
+            "text": {"body": "Hello", "preview_url": False},
+        }
+
+    @respx.mock
+    async def test_unvalidated_response(self):
+        respx.post(MSG_URL).mock(return_value=httpx.Response(200, json=SEND_RESPONSE))
+        async with WhatsAppClient(access_token="tok", validate_responses=False) as client:
+            result = await MessagesResource(client).send_text(
+                TextMessage(phone_number_id=PHONE, to="5511999999999", body="Hello")
+            )
+        assert result.messaging_product == "whatsapp"
+        assert result.contacts[0].wa_id == "5511999999999"
+        assert result.messages[0].id == "wamid.test"
+        assert result.messages[0].message_status is None
+
+    @respx.mock
+    async def test_preview_url_true(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json=SEND_RESPONSE)
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            await resource.send_text(
-                TextMessage(
-                    phone_number_id=PHONE,
-                    to="5511999999999",
-                    body="https://example.com",
-                    preview_url=True,
-                )
+        resource = MessagesResource(client)
+        await resource.send_text(
+            TextMessage(
+                phone_number_id=PHONE,
+                to="5511999999999",
+                body="https://example.com",
+                preview_url=True,
             )
-        import json
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         assert sent["text"]["preview_url"] is True
 
 
 class TestSendImage:
     @respx.mock
-    async def test_image_by_id(self):
+    async def test_image_by_id(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json=SEND_RESPONSE)
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            await resource.send_image(
-                ImageMessage(
-                    phone_number_id=PHONE,
-                    to="5511999999999",
-                    image=MediaById(id="media123", caption="pic"),
-                )
+        resource = MessagesResource(client)
+        await resource.send_image(
+            ImageMessage(
+                phone_number_id=PHONE,
+                to="5511999999999",
+                image=MediaById(id="media123", caption="pic"),
             )
-        import json
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         assert sent["type"] == "image"
         assert sent["image"]["id"] == "media123"
         assert sent["image"]["caption"] == "pic"
 
     @respx.mock
-    async def test_image_by_link(self):
+    async def test_image_by_link(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json=SEND_RESPONSE)
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            await resource.send_image(
-                ImageMessage(
-                    phone_number_id=PHONE,
-                    to="5511999999999",
-                    image=MediaByLink(link="https://example.com/img.jpg"),
-                )
+        resource = MessagesResource(client)
+        await resource.send_image(
+            ImageMessage(
+                phone_number_id=PHONE,
+                to="5511999999999",
+                image=MediaByLink(link="https://example.com/img.jpg"),
             )
-        import json
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         assert sent["image"]["link"] == "https://example.com/img.jpg"
 
+    @respx.mock
+    async def test_constructed_input_skips_validation(self, client):
+        route = respx.post(MSG_URL).mock(
+            return_value=httpx.Response(200, json=SEND_RESPONSE)
+        )
+        msg = ImageMessage.model_construct(
+            phone_number_id=PHONE,
+            to="5511999999999",
+            image=MediaById.model_construct(id="media123"),
+        )
+        await MessagesResource(client).send_image(msg)
+        sent = sent_body(route)
+        assert sent["recipient_type"] == "individual"
+        assert sent["image"] == {"id": "media123"}
+
 
 class TestSendInteractiveButtons:
     @respx.mock
-    async def test_button_format(self):
+    async def test_button_format(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json=SEND_RESPONSE)
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            await resource.send_interactive_buttons(
-                InteractiveButtonsMessage(
-                    phone_number_id=PHONE,
-                    to="5511999999999",
-                    body_text="Choose",
-                    buttons=[
-                        InteractiveButton(id="1", title="Yes"),
-                        InteractiveButton(id="2", title="No"),
-                    ],
-                )
+        resource = MessagesResource(client)
+        await resource.send_interactive_buttons(
+            InteractiveButtonsMessage(
+                phone_number_id=PHONE,
+                to="5511999999999",
+                body_text="Choose",
+                buttons=[
+                    InteractiveButton(id="1", title="Yes"),
+                    InteractiveButton(id="2", title="No"),
+                ],
             )
-        import json
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         assert sent["type"] == "interactive"
         interactive = sent["interactive"]
         assert interactive["type"] == "button"
@@ -147,30 +194,28 @@ class TestSendInteractiveButtons:
 
 class TestSendInteractiveList:
     @respx.mock
-    async def test_list_structure(self):
+    async def test_list_structure(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json=SEND_RESPONSE)
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            await resource.send_interactive_list(
-                InteractiveListMessage(
-                    phone_number_id=PHONE,
-                    to="5511999999999",
-                    body_text="Pick one",
-                    button_text="Menu",
-                    sections=[
-                        ListSection(
-                            title="Section 1",
-                            rows=[
-                                ListRow(id="r1", title="Row 1", description="Desc 1"),
-                            ],
-                        )
-                    ],
-                )
+        resource = MessagesResource(client)
+        await resource.send_interactive_list(
+            InteractiveListMessage(
+                phone_number_id=PHONE,
+                to="5511999999999",
+                body_text="Pick one",
+                button_text="Menu",
+                sections=[
+                    ListSection(
+                        title="Section 1",
+                        rows=[
+                            ListRow(id="r1", title="Row 1", description="Desc 1"),
+                        ],
+                    )
+                ],
             )
-        import json
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         interactive = sent["interactive"]
         assert interactive["type"] == "list"
         action = interactive["action"]
@@ -179,82 +224,150 @@ class TestSendInteractiveList:
         assert action["sections"][0]["title"] == "Section 1"
         assert action["sections"][0]["rows"][0]["id"] == "r1"
 
+    @respx.mock
+    async def test_untitled_section_omits_title(self, client):
+        route = respx.post(MSG_URL).mock(
+            return_value=httpx.Response(200, json=SEND_RESPONSE)
+        )
+        await MessagesResource(client).send_interactive_list(
+            InteractiveListMessage(
+                phone_number_id=PHONE,
+                to="5511999999999",
+                body_text="Pick one",
+                button_text="Menu",
+                sections=[ListSection(rows=[ListRow(id="r1", title="Row 1")])],
+            )
+        )
+        sent = sent_body(route)
+        assert sent["interactive"]["action"]["sections"] == [
+            {"rows": [{"id": "r1", "title": "Row 1"}]}
+        ]
+
 
 class TestSendInteractiveCatalog:
     @respx.mock
-    async def test_without_thumbnail(self):
+    async def test_without_thumbnail(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json=SEND_RESPONSE)
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            await resource.send_interactive_catalog(
-                InteractiveCatalogMessage(
-                    phone_number_id=PHONE,
-                    to="5511999999999",
-                    body_text="Browse",
-                )
+        resource = MessagesResource(client)
+        await resource.send_interactive_catalog(
+            InteractiveCatalogMessage(
+                phone_number_id=PHONE,
+                to="5511999999999",
+                body_text="Browse",
             )
-        import json
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         action = sent["interactive"]["action"]
         assert action["name"] == "catalog_message"
         assert "parameters" not in action
 
     @respx.mock
-    async def test_with_thumbnail(self):
+    async def test_with_thumbnail(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json=SEND_RESPONSE)
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            await resource.send_interactive_catalog(
-                InteractiveCatalogMessage(
-                    phone_number_id=PHONE,
-                    to="5511999999999",
-                    parameters=CatalogParameters(thumbnail_product_retailer_id="prod1"),
-                )
+        resource = MessagesResource(client)
+        await resource.send_interactive_catalog(
+            InteractiveCatalogMessage(
+                phone_number_id=PHONE,
+                to="5511999999999",
+                parameters=CatalogParameters(thumbnail_product_retailer_id="prod1"),
             )
-        import json
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         action = sent["interactive"]["action"]
         assert action["parameters"]["thumbnail_product_retailer_id"] == "prod1"
+        assert _CATALOG_ACTION == {"name": "catalog_message"}
 
 
 class TestSendInteractiveRaw:
     @respx.mock
-    async def test_raw_passthrough(self):
+    async def test_raw_passthrough(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json=SEND_RESPONSE)
         )
         raw_interactive = {"type": "custom", "action": {"name": "test"}}
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            await resource.send_interactive_raw(
-                phone_number_id=PHONE,
-                to="5511999999999",
-                interactive=raw_interactive,
-            )
-        import json
-        sent = json.loads(route.calls[0].request.content)
+        resource = MessagesResource(client)
+        await resource.send_interactive_raw(
+            phone_number_id=PHONE,
+            to="5511999999999",
+            interactive=raw_interactive,
+        )
+        sent = sent_body(route)
         assert sent["interactive"] == raw_interactive
         assert sent["type"] == "interactive"
 
 
 class TestMarkRead:
     @respx.mock
-    async def test_body_structure(self):
+    async def test_body_structure(self, client):
         route = respx.post(MSG_URL).mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MessagesResource(client)
-            result = await resource.mark_read(
-                MarkReadInput(phone_number_id=PHONE, message_id="wamid.1")
-            )
-        import json
-        sent = json.loads(route.calls[0].request.content)
+        resource = MessagesResource(client)
+        result = await resource.mark_read(
+            MarkReadInput(phone_number_id=PHONE, message_id="wamid.1")
+        )
+        sent = sent_body(route)
         assert sent["messaging_product"] == "whatsapp"
         assert sent["status"] == "read"
         assert sent["message_id"] == "wamid.1"
         assert result == {"success": True}
+
+    @respx.mock
+    async def test_mark_read_many(self, client):
+        route = respx.post(MSG_URL).mock(
+            return_value=httpx.Response(200, json={"success": True})
+        )
+        results = await MessagesResource(client).mark_read_many(
+            [MarkReadInput(phone_number_id=PHONE, message_id=f"wamid.{i}") for i in range(3)]
+        )
+        assert results == [{"success": True}] * 3
+        assert route.call_count == 3
+
+
+class TestSendTextBulk:
+    @respx.mock
+    async def test_results_in_input_order(self, client):
+
+        def reply(request: httpx.Request) -> httpx.Response:
+            to = json.loads(request.content)["to"]
+            return httpx.Response(200, json={"messages": [{"id": f"wamid.{to}"}]})
+
+        respx.post(MSG_URL).mock(side_effect=reply)
+        results = await MessagesResource(client).send_text_bulk(
+            [TextMessage(phone_number_id=PHONE, to=str(i), body="Hi") for i in range(5)]
+        )
+        assert [r.messages[0].id for r in results] == [f"wamid.{i}" for i in range(5)]
+
+    @respx.mock
+    async def test_return_exceptions(self, client):
+        def reply(request: httpx.Request) -> httpx.Response:
+            if json.loads(request.content)["to"] == "1":
+                return httpx.Response(400, json={"error": {"message": "Bad", "code": 100}})
+            return httpx.Response(200, json=SEND_RESPONSE)
+
+        respx.post(MSG_URL).mock(side_effect=reply)
+        results = await MessagesResource(client).send_text_bulk(
+            [TextMessage(phone_number_id=PHONE, to=str(i), body="Hi") for i in range(2)],
+            return_exceptions=True,
+        )
+        assert results[0].messages[0].id == "wamid.test"
+        assert isinstance(results[1], GraphApiError)
+
+    @respx.mock
+    async def test_first_failure_stops_remaining_sends(self, client):
+        def reply(request: httpx.Request) -> httpx.Response:
+            if json.loads(request.content)["to"] == "1":
+                return httpx.Response(400, json={"error": {"message": "Bad", "code": 100}})
+            return httpx.Response(200, json=SEND_RESPONSE)
+
+        route = respx.post(MSG_URL).mock(side_effect=reply)
+        with pytest.raises(GraphApiError):
+            await MessagesResource(client).send_text_bulk(
+                [TextMessage(phone_number_id=PHONE, to=str(i), body="Hi") for i in range(5)],
+                concurrency=1,
+            )
+        assert route.call_count == 2
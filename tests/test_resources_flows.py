@@ -6,7 +6,6 @@ import httpx
 import pytest
 import respx
 
-from whatsapp_cloud_api.client import WhatsAppClient
 from whatsapp_cloud_api.resources.flows import (
     CreateFlowInput,
     DeployFlowInput,
@@ -16,136 +15,145 @@ from whatsapp_cloud_api.resources.flows import (
 
 BASE = "https://api.kapso.ai/meta/whatsapp/v24.0"
 WABA = "waba123"
+FLOWS_URL = f"{BASE}/{WABA}/flows"
+ASSETS_URL = f"{BASE}/flow1/assets"
+PUBLISH_URL = f"{BASE}/flow1/publish"
 
 
 class TestCreate:
     @respx.mock
-    async def test_create_without_publish(self):
-        route = respx.post(f"{BASE}/{WABA}/flows").mock(
+    async def test_create_without_publish(self, client):
+        route = respx.post(FLOWS_URL).mock(
             return_value=httpx.Response(200, json={"id": "flow1"})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = FlowsResource(client)
-            result = await resource.create(
-                CreateFlowInput(
-                    waba_id=WABA,
-                    name="My Flow",
-                    flow_json={"screens": []},
-                )
+        resource = FlowsResource(client)
+        result = await resource.create(
+            CreateFlowInput(
+                waba_id=WABA,
+                name="My Flow",
+                flow_json={"screens": []},
             )
+        )
         assert result == {"id": "flow1"}
         assert route.called
 
     @respx.mock
-    async def test_create_with_publish(self):
-        respx.post(f"{BASE}/{WABA}/flows").mock(
+    async def test_create_multipart_json_parts(self, client):
+        route = respx.post(FLOWS_URL).mock(
             return_value=httpx.Response(200, json={"id": "flow1"})
         )
-        publish_route = respx.post(f"{BASE}/flow1/publish").mock(
+        resource = FlowsResource(client)
+        await resource.create(
+            CreateFlowInput(waba_id=WABA, name="My Flow", flow_json={"version": "6.0"})
+        )
+        body = route.calls[0].request.content
+        assert b'["OTHER"]' in body
+        assert b'{"version":"6.0"}' in body
+
+    @respx.mock
+    async def test_create_with_publish(self, client):
+        respx.post(FLOWS_URL).mock(
+            return_value=httpx.Response(200, json={"id": "flow1"})
+        )
+        publish_route = respx.post(PUBLISH_URL).mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = FlowsResource(client)
-            await resource.create(
-                CreateFlowInput(
-                    waba_id=WABA,
-                    name="My Flow",
-                    flow_json={"screens": []},
-                    publish=True,
-                )
+        resource = FlowsResource(client)
+        await resource.create(
+            CreateFlowInput(
+                waba_id=WABA,
+                name="My Flow",
+                flow_json={"screens": []},
+                publish=True,
             )
+        )
         assert publish_route.called
 
 
 class TestUpdateAsset:
     @respx.mock
-    async def test_with_json_data(self):
-        route = respx.post(f"{BASE}/flow1/assets").mock(
+    async def test_with_json_data(self, client):
+        route = respx.post(ASSETS_URL).mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = FlowsResource(client)
-            result = await resource.update_asset(
-                UpdateFlowAssetInput(flow_id="flow1", json_data={"screens": []})
-            )
+        resource = FlowsResource(client)
+        result = await resource.update_asset(
+            UpdateFlowAssetInput(flow_id="flow1", json_data={"screens": []})
+        )
         assert result == {"success": True}
         assert route.called
 
     @respx.mock
-    async def test_with_file_bytes(self):
-        route = respx.post(f"{BASE}/flow1/assets").mock(
+    async def test_with_file_bytes(self, client):
+        route = respx.post(ASSETS_URL).mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = FlowsResource(client)
-            await resource.update_asset(
-                UpdateFlowAssetInput(flow_id="flow1", file=b'{"screens": []}')
-            )
+        resource = FlowsResource(client)
+        await resource.update_asset(
+            UpdateFlowAssetInput(flow_id="flow1", file=b'{"screens": []}')
+        )
         assert route.called
 
     async def test_neither_raises_value_error(self):
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = FlowsResource(client)
-            with pytest.raises(ValueError, match="Either json_data or file must be provided"):
-                await resource.update_asset(
-                    UpdateFlowAssetInput(flow_id="flow1")
-                )
+        # Input is rejected before the client is touched, so none is built.
+        resource = FlowsResource(None)  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Either json_data or file must be provided"):
+            await resource.update_asset(
+                UpdateFlowAssetInput(flow_id="flow1")
+            )
 
 
 class TestDeploy:
     @respx.mock
-    async def test_deploy_new_flow(self):
-        create_route = respx.post(f"{BASE}/{WABA}/flows").mock(
+    async def test_deploy_new_flow(self, client):
+        create_route = respx.post(FLOWS_URL).mock(
             return_value=httpx.Response(200, json={"id": "new_flow"})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = FlowsResource(client)
-            result = await resource.deploy(
-                DeployFlowInput(
-                    waba_id=WABA,
-                    name="Deploy Flow",
-                    flow_json={"screens": []},
-                )
+        resource = FlowsResource(client)
+        result = await resource.deploy(
+            DeployFlowInput(
+                waba_id=WABA,
+                name="Deploy Flow",
+                flow_json={"screens": []},
             )
+        )
         assert create_route.called
         assert result["flow_id"] == "new_flow"
         assert result["published"] is False
 
     @respx.mock
-    async def test_deploy_existing_flow(self):
+    async def test_deploy_existing_flow(self, client):
         update_route = respx.post(f"{BASE}/existing_flow/assets").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = FlowsResource(client)
-            result = await resource.deploy(
-                DeployFlowInput(
-                    waba_id=WABA,
-                    name="Deploy Flow",
-                    flow_json={"screens": []},
-                    flow_id="existing_flow",
-                )
+        resource = FlowsResource(client)
+        result = await resource.deploy(
+            DeployFlowInput(
+                waba_id=WABA,
+                name="Deploy Flow",
+                flow_json={"screens": []},
+                flow_id="existing_flow",
             )
+        )
         assert update_route.called
         assert result["flow_id"] == "existing_flow"
 
     @respx.mock
-    async def test_deploy_with_publish(self):
-        respx.post(f"{BASE}/{WABA}/flows").mock(
+    async def test_deploy_with_publish(self, client):
+        respx.post(FLOWS_URL).mock(
             return_value=httpx.Response(200, json={"id": "flow_pub"})
         )
         publish_route = respx.post(f"{BASE}/flow_pub/publish").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = FlowsResource(client)
-            result = await resource.deploy(
-                DeployFlowInput(
-                    waba_id=WABA,
-                    name="Deploy Flow",
-                    flow_json={"screens": []},
-                    publish=True,
-                )
+        resource = FlowsResource(client)
+        result = await resource.deploy(
+            DeployFlowInput(
+                waba_id=WABA,
+                name="Deploy Flow",
+                flow_json={"screens": []},
+                publish=True,
             )
+        )
         assert publish_route.called
         assert result["published"] is True
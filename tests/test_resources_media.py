@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 import httpx
 import respx
 
@@ -9,37 +11,73 @@ from whatsapp_cloud_api.client import WhatsAppClient
 from whatsapp_cloud_api.resources.media import MediaResource, MediaUploadInput
 
 BASE = "https://api.kapso.ai/meta/whatsapp/v24.0"
+MEDIA_URL = f"{BASE}/media123"
+UPLOAD_URL = f"{BASE}/123/media"
+
+# Metadata for a media item served from a plain CDN URL (download tests).
+CDN_URL = "https://cdn.example.com/media/file.jpg"
+CDN_META = {
+    "messaging_product": "whatsapp",
+    "url": CDN_URL,
+    "mime_type": "image/jpeg",
+    "sha256": "abc",
+    "file_size": "100",
+    "id": "media123",
+}
 
 
 class TestUpload:
     @respx.mock
-    async def test_upload_multipart(self):
-        route = respx.post(f"{BASE}/123/media").mock(
+    async def test_upload_multipart(self, client):
+        route = respx.post(UPLOAD_URL).mock(
             return_value=httpx.Response(200, json={"id": "media_id_1"})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MediaResource(client)
-            result = await resource.upload(
-                MediaUploadInput(
-                    phone_number_id="123",
-                    type="image",
-                    file=b"fakeimagebytes",
-                    filename="photo.jpg",
-                    mime_type="image/jpeg",
-                )
+        resource = MediaResource(client)
+        result = await resource.upload(
+            MediaUploadInput(
+                phone_number_id="123",
+                type="image",
+                file=b"fakeimagebytes",
+                filename="photo.jpg",
+                mime_type="image/jpeg",
             )
+        )
         assert result.id == "media_id_1"
         assert route.called
         # Verify content type is multipart
         req = route.calls[0].request
-        assert b"multipart/form-data" in req.headers.get("content-type", "").encode() or \
-            "multipart" in req.headers.get("content-type", "")
+        assert "multipart/form-data" in req.headers.get("content-type", "")
+
+    @respx.mock
+    async def test_upload_from_path(self, client, tmp_path):
+        path = tmp_path / "clip.mp4"
+        path.write_bytes(b"fakevideobytes")
+        route = respx.post(UPLOAD_URL).mock(
+            return_value=httpx.Response(200, json={"id": "media_id_2"})
+        )
+        result = await MediaResource(client).upload(
+            MediaUploadInput(phone_number_id="123", type="video", file=path)
+        )
+        assert result.id == "media_id_2"
+        assert b"fakevideobytes" in route.calls[0].request.content
+
+    @respx.mock
+    async def test_upload_from_file_object(self, client):
+        route = respx.post(UPLOAD_URL).mock(
+            return_value=httpx.Response(200, json={"id": "media_id_3"})
+        )
+        fh = io.BytesIO(b"streamedbytes")
+        await MediaResource(client).upload(
+            MediaUploadInput(phone_number_id="123", type="document", file=fh)
+        )
+        assert b"streamedbytes" in route.calls[0].request.content
+        assert not fh.closed
 
 
 class TestGet:
     @respx.mock
-    async def test_get_metadata(self):
-        respx.get(f"{BASE}/media123").mock(
+    async def test_get_metadata(self, client):
+        respx.get(MEDIA_URL).mock(
             return_value=httpx.Response(
                 200,
                 json={
@@ -52,89 +90,99 @@ class TestGet:
                 },
             )
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MediaResource(client)
-            meta = await resource.get("media123")
+        resource = MediaResource(client)
+        meta = await resource.get("media123")
         assert meta.id == "media123"
         assert meta.url == "https://cdn.example.com/file"
         assert meta.mime_type == "image/jpeg"
 
-
-class TestDelete:
-    @respx.mock
-    async def test_delete(self):
-        route = respx.delete(f"{BASE}/media123").mock(
-            return_value=httpx.Response(200, json={"success": True})
-        )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MediaResource(client)
-            result = await resource.delete("media123")
-        assert result == {"success": True}
-        assert route.called
-
-
-class TestDownload:
     @respx.mock
-    async def test_download_without_auth(self):
-        cdn_url = "https://cdn.example.com/media/file.jpg"
-        # First call: get metadata
-        respx.get(f"{BASE}/media123").mock(
+    async def test_get_metadata_camel_case_body(self, client):
+        respx.get(MEDIA_URL).mock(
             return_value=httpx.Response(
                 200,
                 json={
-                    "messaging_product": "whatsapp",
-                    "url": cdn_url,
-                    "mime_type": "image/jpeg",
+                    "messagingProduct": "whatsapp",
+                    "url": "https://cdn.example.com/file",
+                    "downloadUrl": "https://cdn.example.com/dl",
+                    "mimeType": "image/jpeg",
                     "sha256": "abc",
-                    "file_size": "100",
+                    "fileSize": "1024",
                     "id": "media123",
                 },
             )
         )
-        # Second call: download from CDN (no auth)
-        respx.get(cdn_url).mock(
-            return_value=httpx.Response(200, content=b"image-bytes")
-        )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MediaResource(client)
-            data = await resource.download("media123")
-        assert data == b"image-bytes"
+        meta = await MediaResource(client).get("media123")
+        assert meta.download_url == "https://cdn.example.com/dl"
+        assert meta.mime_type == "image/jpeg"
 
     @respx.mock
-    async def test_download_retry_on_401(self):
-        cdn_url = "https://cdn.example.com/media/file.jpg"
-        respx.get(f"{BASE}/media123").mock(
+    async def test_get_metadata_unvalidated(self):
+        respx.get(MEDIA_URL).mock(
             return_value=httpx.Response(
                 200,
                 json={
-                    "messaging_product": "whatsapp",
-                    "url": cdn_url,
+                    "url": "https://cdn.example.com/file",
                     "mime_type": "image/jpeg",
                     "sha256": "abc",
-                    "file_size": "100",
+                    "file_size": "1024",
                     "id": "media123",
                 },
             )
         )
+        async with WhatsAppClient(access_token="tok", validate_responses=False) as client:
+            meta = await MediaResource(client).get("media123")
+        assert meta.mime_type == "image/jpeg"
+        assert meta.messaging_product == "whatsapp"
+        assert meta.download_url is None
+
+
+class TestDelete:
+    @respx.mock
+    async def test_delete(self, client):
+        route = respx.delete(MEDIA_URL).mock(
+            return_value=httpx.Response(200, json={"success": True})
+        )
+        resource = MediaResource(client)
+        result = await resource.delete("media123")
+        assert result == {"success": True}
+        assert route.called
+
+
+class TestDownload:
+    @respx.mock
+    async def test_download_without_auth(self, client):
+        # First call: get metadata
+        respx.get(MEDIA_URL).mock(return_value=httpx.Response(200, json=CDN_META))
+        # Second call: download from CDN (no auth)
+        respx.get(CDN_URL).mock(
+            return_value=httpx.Response(200, content=b"image-bytes")
+        )
+        resource = MediaResource(client)
+        data = await resource.download("media123")
+        assert data == b"image-bytes"
+
+    @respx.mock
+    async def test_download_retry_on_401(self, client):
+        respx.get(MEDIA_URL).mock(return_value=httpx.Response(200, json=CDN_META))
         # First CDN request returns 401, second (with auth) succeeds
-        cdn_route = respx.get(cdn_url).mock(
+        cdn_route = respx.get(CDN_URL).mock(
             side_effect=[
                 httpx.Response(401, content=b""),
                 httpx.Response(200, content=b"image-bytes-auth"),
             ]
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MediaResource(client)
-            data = await resource.download("media123")
+        resource = MediaResource(client)
+        data = await resource.download("media123")
         assert data == b"image-bytes-auth"
         # Two CDN calls: raw fetch + auth retry
         assert cdn_route.call_count == 2
 
     @respx.mock
-    async def test_download_prefers_download_url_over_url(self):
+    async def test_download_prefers_download_url_over_url(self, client):
         meta_url = "https://lookaside.fbsbx.com/whatsapp_business/attachments/?mid=MEDIA_ID"
         kapso_download_url = "https://api.kapso.ai/meta/whatsapp/media_download?token=abc123"
-        respx.get(f"{BASE}/media123").mock(
+        respx.get(MEDIA_URL).mock(
             return_value=httpx.Response(
                 200,
                 json={
@@ -154,35 +202,20 @@ class TestDownload:
         meta_route = respx.get(meta_url).mock(
             return_value=httpx.Response(200, content=b"should-not-be-called")
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MediaResource(client)
-            data = await resource.download("media123")
+        resource = MediaResource(client)
+        data = await resource.download("media123")
         assert data == b"\x07\x07\x07\x07"
         assert kapso_route.called
         assert not meta_route.called
 
     @respx.mock
-    async def test_download_with_use_auth(self):
-        cdn_url = "https://cdn.example.com/media/file.jpg"
-        respx.get(f"{BASE}/media123").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "messaging_product": "whatsapp",
-                    "url": cdn_url,
-                    "mime_type": "image/jpeg",
-                    "sha256": "abc",
-                    "file_size": "100",
-                    "id": "media123",
-                },
-            )
-        )
-        cdn_route = respx.get(cdn_url).mock(
+    async def test_download_with_use_auth(self, client):
+        respx.get(MEDIA_URL).mock(return_value=httpx.Response(200, json=CDN_META))
+        cdn_route = respx.get(CDN_URL).mock(
             return_value=httpx.Response(200, content=b"auth-bytes")
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = MediaResource(client)
-            data = await resource.download("media123", use_auth=True)
+        resource = MediaResource(client)
+        data = await resource.download("media123", use_auth=True)
         assert data == b"auth-bytes"
         # With use_auth=True, the first call already has auth headers
         req = cdn_route.calls[0].request
@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import json
-
 import httpx
 import respx
 
-from whatsapp_cloud_api.client import WhatsAppClient
+from tests.conftest import sent_body
 from whatsapp_cloud_api.resources.phone_numbers import (
     DeregisterInput,
     PhoneNumbersResource,
@@ -23,111 +21,104 @@ PHONE = "1234567890"
 
 class TestRequestCode:
     @respx.mock
-    async def test_request_code(self):
+    async def test_request_code(self, client):
         route = respx.post(f"{BASE}/{PHONE}/request_code").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = PhoneNumbersResource(client)
-            result = await resource.request_code(
-                RequestCodeInput(phone_number_id=PHONE, code_method="SMS", language="en")
-            )
+        resource = PhoneNumbersResource(client)
+        result = await resource.request_code(
+            RequestCodeInput(phone_number_id=PHONE, code_method="SMS", language="en")
+        )
         assert result == {"success": True}
-        sent = json.loads(route.calls[0].request.content)
+        sent = sent_body(route)
         assert sent["code_method"] == "SMS"
         assert sent["language"] == "en"
 
 
 class TestVerifyCode:
     @respx.mock
-    async def test_verify_code(self):
+    async def test_verify_code(self, client):
         route = respx.post(f"{BASE}/{PHONE}/verify_code").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = PhoneNumbersResource(client)
-            await resource.verify_code(
-                VerifyCodeInput(phone_number_id=PHONE, code="123456")
-            )
-        sent = json.loads(route.calls[0].request.content)
+        resource = PhoneNumbersResource(client)
+        await resource.verify_code(
+            VerifyCodeInput(phone_number_id=PHONE, code="123456")
+        )
+        sent = sent_body(route)
         assert sent["code"] == "123456"
 
 
 class TestRegister:
     @respx.mock
-    async def test_register_basic(self):
+    async def test_register_basic(self, client):
         route = respx.post(f"{BASE}/{PHONE}/register").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = PhoneNumbersResource(client)
-            await resource.register(RegisterInput(phone_number_id=PHONE, pin="123456"))
-        sent = json.loads(route.calls[0].request.content)
+        resource = PhoneNumbersResource(client)
+        await resource.register(RegisterInput(phone_number_id=PHONE, pin="123456"))
+        sent = sent_body(route)
         assert sent["messaging_product"] == "whatsapp"
         assert sent["pin"] == "123456"
         assert "data_localization_region" not in sent
 
     @respx.mock
-    async def test_register_with_data_localization(self):
+    async def test_register_with_data_localization(self, client):
         route = respx.post(f"{BASE}/{PHONE}/register").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = PhoneNumbersResource(client)
-            await resource.register(
-                RegisterInput(
-                    phone_number_id=PHONE, pin="123456", data_localization_region="BR"
-                )
+        resource = PhoneNumbersResource(client)
+        await resource.register(
+            RegisterInput(
+                phone_number_id=PHONE, pin="123456", data_localization_region="BR"
             )
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         assert sent["data_localization_region"] == "BR"
 
 
 class TestDeregister:
     @respx.mock
-    async def test_deregister(self):
+    async def test_deregister(self, client):
         route = respx.post(f"{BASE}/{PHONE}/deregister").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = PhoneNumbersResource(client)
-            await resource.deregister(DeregisterInput(phone_number_id=PHONE))
-        sent = json.loads(route.calls[0].request.content)
+        resource = PhoneNumbersResource(client)
+        await resource.deregister(DeregisterInput(phone_number_id=PHONE))
+        sent = sent_body(route)
         assert sent == {}
         assert route.called
 
 
 class TestBusinessProfileSubResource:
     @respx.mock
-    async def test_get(self):
+    async def test_get(self, client):
         route = respx.get(f"{BASE}/{PHONE}/whatsapp_business_profile").mock(
             return_value=httpx.Response(
                 200,
                 json={"data": [{"about": "Test business", "description": "Desc"}]},
             )
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = PhoneNumbersResource(client)
-            result = await resource.business_profile.get(PHONE)
+        resource = PhoneNumbersResource(client)
+        result = await resource.business_profile.get(PHONE)
         assert len(result.data) == 1
         assert result.data[0].about == "Test business"
         assert route.called
 
     @respx.mock
-    async def test_update(self):
+    async def test_update(self, client):
         route = respx.post(f"{BASE}/{PHONE}/whatsapp_business_profile").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = PhoneNumbersResource(client)
-            await resource.business_profile.update(
-                UpdateBusinessProfileInput(
-                    phone_number_id=PHONE,
-                    about="New about",
-                    description="New desc",
-                )
+        resource = PhoneNumbersResource(client)
+        await resource.business_profile.update(
+            UpdateBusinessProfileInput(
+                phone_number_id=PHONE,
+                about="New about",
+                description="New desc",
             )
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         assert sent["about"] == "New about"
         assert sent["description"] == "New desc"
         assert sent["messaging_product"] == "whatsapp"
@@ -5,9 +5,11 @@ from __future__ import annotations
 import json
 
 import httpx
+import pytest
 import respx
 
-from whatsapp_cloud_api.client import WhatsAppClient
+from tests.conftest import sent_body
+from whatsapp_cloud_api.errors import GraphApiError
 from whatsapp_cloud_api.resources.templates.models import (
     TemplateCreateInput,
     TemplateDeleteInput,
@@ -21,148 +23,193 @@ WABA = "waba123"
 
 class TestList:
     @respx.mock
-    async def test_list_no_filters(self):
+    async def test_list_no_filters(self, client):
         route = respx.get(f"{BASE}/{WABA}/message_templates").mock(
             return_value=httpx.Response(200, json={"data": [], "paging": {}})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = TemplatesResource(client)
-            result = await resource.list(TemplateListInput(business_account_id=WABA))
+        resource = TemplatesResource(client)
+        result = await resource.list(TemplateListInput(business_account_id=WABA))
         assert result.data == []
         assert route.called
 
     @respx.mock
-    async def test_list_with_filters(self):
+    async def test_list_with_filters(self, client):
         route = respx.get(f"{BASE}/{WABA}/message_templates").mock(
             return_value=httpx.Response(200, json={"data": [], "paging": {}})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = TemplatesResource(client)
-            await resource.list(
-                TemplateListInput(
-                    business_account_id=WABA,
-                    limit=10,
-                    status="APPROVED",
-                    name="welcome",
-                    category="MARKETING",
-                    language="en_US",
-                )
+        resource = TemplatesResource(client)
+        await resource.list(
+            TemplateListInput(
+                business_account_id=WABA,
+                limit=10,
+                status="APPROVED",
+                name="welcome",
+                category="MARKETING",
+                language="en_US",
             )
+        )
         req = route.calls[0].request
-        assert "limit=10" in str(req.url)
-        assert "status=APPROVED" in str(req.url)
-        assert "name=welcome" in str(req.url)
+        assert req.url.params["limit"] == "10"
+        assert req.url.params["status"] == "APPROVED"
+        assert req.url.params["name"] == "welcome"
 
     @respx.mock
-    async def test_list_none_filters_excluded(self):
+    async def test_list_none_filters_excluded(self, client):
         route = respx.get(f"{BASE}/{WABA}/message_templates").mock(
             return_value=httpx.Response(200, json={"data": [], "paging": {}})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = TemplatesResource(client)
-            await resource.list(
-                TemplateListInput(business_account_id=WABA, limit=None, name=None)
-            )
+        resource = TemplatesResource(client)
+        await resource.list(
+            TemplateListInput(business_account_id=WABA, limit=None, name=None)
+        )
         req = route.calls[0].request
-        assert "limit" not in str(req.url)
-        assert "name" not in str(req.url)
+        assert "limit" not in req.url.params
+        assert "name" not in req.url.params
 
 
 class TestCreate:
     @respx.mock
-    async def test_create_basic(self):
+    async def test_create_basic(self, client):
         route = respx.post(f"{BASE}/{WABA}/message_templates").mock(
             return_value=httpx.Response(200, json={"id": "tpl1", "status": "PENDING"})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = TemplatesResource(client)
-            result = await resource.create(
-                TemplateCreateInput(
-                    business_account_id=WABA,
-                    name="test",
-                    language="en_US",
-                    category="MARKETING",
-                    components=[{"type": "BODY", "text": "Hello {{1}}"}],
-                )
+        resource = TemplatesResource(client)
+        result = await resource.create(
+            TemplateCreateInput(
+                business_account_id=WABA,
+                name="test",
+                language="en_US",
+                category="MARKETING",
+                components=[{"type": "BODY", "text": "Hello {{1}}"}],
             )
+        )
         assert result.id == "tpl1"
-        sent = json.loads(route.calls[0].request.content)
+        sent = sent_body(route)
         assert sent["name"] == "test"
         assert sent["language"] == "en_US"
         assert sent["category"] == "MARKETING"
 
     @respx.mock
-    async def test_create_with_optional_fields(self):
+    async def test_create_with_optional_fields(self, client):
         route = respx.post(f"{BASE}/{WABA}/message_templates").mock(
             return_value=httpx.Response(200, json={"id": "tpl2"})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = TemplatesResource(client)
-            await resource.create(
-                TemplateCreateInput(
-                    business_account_id=WABA,
-                    name="test",
-                    language="en_US",
-                    category="MARKETING",
-                    components=[],
-                    parameter_format="NAMED",
-                    allow_category_change=True,
-                )
+        resource = TemplatesResource(client)
+        await resource.create(
+            TemplateCreateInput(
+                business_account_id=WABA,
+                name="test",
+                language="en_US",
+                category="MARKETING",
+                components=[],
+                parameter_format="NAMED",
+                allow_category_change=True,
             )
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         assert sent["parameter_format"] == "NAMED"
         assert sent["allow_category_change"] is True
 
     @respx.mock
-    async def test_create_without_optional_fields(self):
+    async def test_create_without_optional_fields(self, client):
         route = respx.post(f"{BASE}/{WABA}/message_templates").mock(
             return_value=httpx.Response(200, json={"id": "tpl3"})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = TemplatesResource(client)
-            await resource.create(
-                TemplateCreateInput(
-                    business_account_id=WABA,
-                    name="test",
-                    language="en_US",
-                    category="MARKETING",
-                    components=[],
-                )
+        resource = TemplatesResource(client)
+        await resource.create(
+            TemplateCreateInput(
+                business_account_id=WABA,
+                name="test",
+                language="en_US",
+                category="MARKETING",
+                components=[],
             )
-        sent = json.loads(route.calls[0].request.content)
+        )
+        sent = sent_body(route)
         assert "parameter_format" not in sent
         assert "allow_category_change" not in sent
 
 
 class TestDelete:
     @respx.mock
-    async def test_delete_by_name_only(self):
+    async def test_delete_by_name_only(self, client):
         route = respx.delete(f"{BASE}/{WABA}/message_templates").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = TemplatesResource(client)
-            result = await resource.delete(
-                TemplateDeleteInput(business_account_id=WABA, name="old_template")
-            )
+        resource = TemplatesResource(client)
+        result = await resource.delete(
+            TemplateDeleteInput(business_account_id=WABA, name="old_template")
+        )
         assert result.success is True
         req = route.calls[0].request
-        assert "name=old_template" in str(req.url)
-        assert "hsm_id" not in str(req.url)
+        assert req.url.params["name"] == "old_template"
+        assert "hsm_id" not in req.url.params
 
     @respx.mock
-    async def test_delete_with_language(self):
+    async def test_delete_with_language(self, client):
         route = respx.delete(f"{BASE}/{WABA}/message_templates").mock(
             return_value=httpx.Response(200, json={"success": True})
         )
-        async with WhatsAppClient(access_token="tok") as client:
-            resource = TemplatesResource(client)
-            await resource.delete(
-                TemplateDeleteInput(
+        resource = TemplatesResource(client)
+        await resource.delete(
+            TemplateDeleteInput(
+                business_account_id=WABA,
+                name="old_template",
+                language="en_US",
+            )
+        )
+        req = route.calls[0].request
+        assert req.url.params["hsm_id"] == "en_US"
+
+
+class TestMany:
+    @respx.mock
+    async def test_create_many_in_order(self, client):
+        def reply(request: httpx.Request) -> httpx.Response:
+            name = json.loads(request.content)["name"]
+            return httpx.Response(200, json={"id": f"id_{name}", "status": "PENDING"})
+
+        respx.post(f"{BASE}/{WABA}/message_templates").mock(side_effect=reply)
+        results = await TemplatesResource(client).create_many(
+            [
+                TemplateCreateInput(
                     business_account_id=WABA,
-                    name="old_template",
+                    name=f"tpl{i}",
                     language="en_US",
+                    category="UTILITY",
+                    components=[],
                 )
+                for i in range(3)
+            ]
+        )
+        assert [r.id for r in results] == ["id_tpl0", "id_tpl1", "id_tpl2"]
+
+    @respx.mock
+    async def test_delete_many_return_exceptions(self, client):
+        def reply(request: httpx.Request) -> httpx.Response:
+            if request.url.params["name"] == "missing":
+                return httpx.Response(400, json={"error": {"message": "Bad", "code": 100}})
+            return httpx.Response(200, json={"success": True})
+
+        respx.delete(f"{BASE}/{WABA}/message_templates").mock(side_effect=reply)
+        results = await TemplatesResource(client).delete_many(
+            [
+                TemplateDeleteInput(business_account_id=WABA, name="old"),
+                TemplateDeleteInput(business_account_id=WABA, name="missing"),
+            ],
+            return_exceptions=True,
+        )
+        assert results[0].success is True
+        assert isinstance(results[1], GraphApiError)
+
+    @respx.mock
+    async def test_delete_many_stops_after_failure(self, client):
+        route = respx.delete(f"{BASE}/{WABA}/message_templates").mock(
+            return_value=httpx.Response(400, json={"error": {"message": "Bad", "code": 100}})
+        )
+        with pytest.raises(GraphApiError):
+            await TemplatesResource(client).delete_many(
+                [TemplateDeleteInput(business_account_id=WABA, name=f"t{i}") for i in range(3)],
+                concurrency=1,
             )
-        req = route.calls[0].request
-        assert "hsm_id=en_US" in str(req.url)
+        assert route.call_count == 1
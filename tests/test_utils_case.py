@@ -1,5 +1,8 @@
 """Tests for utils/case.py — pure function case conversion."""
 
+import sys
+from collections import OrderedDict
+
 from whatsapp_cloud_api.utils.case import to_camel, to_camel_deep, to_snake, to_snake_deep
 
 # ── to_camel ────────────────────────────────────────────────────────
@@ -22,13 +25,21 @@ class TestToCamel:
         assert to_camel("") == ""
 
     def test_leading_underscore_preserved(self):
-        # _CAMEL_RE only matches _[a-z0-9], so leading underscore before uppercase stays
+        # Only "_" before [a-z0-9] is folded, so a leading "_p" becomes "P"
         result = to_camel("_private")
         assert result == "Private"
 
     def test_multiple_underscores(self):
         assert to_camel("a_b_c") == "aBC"
 
+    def test_underscore_before_non_lowercase_kept(self):
+        assert to_camel("a__b") == "a_B"
+        assert to_camel("a_B") == "a_B"
+        assert to_camel("trail_") == "trail_"
+
+    def test_result_interned(self):
+        assert to_camel("display_phone_number") is sys.intern("displayPhoneNumber")
+
 
 # ── to_snake ────────────────────────────────────────────────────────
 
@@ -98,3 +109,9 @@ class TestToSnakeDeep:
 
     def test_empty_list(self):
         assert to_snake_deep([]) == []
+
+    def test_nested_dict_subclass(self):
+        inner = OrderedDict(fooBar=1)
+        result = to_snake_deep({"a": inner})
+        assert result == {"a": {"foo_bar": 1}}
+        assert result["a"] is not inner
@@ -0,0 +1,70 @@
+"""Tests for utils/concurrency.py — bounded fan-out for bulk helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from whatsapp_cloud_api.utils.concurrency import gather_limited
+
+
+class TestGatherLimited:
+    async def test_results_in_input_order(self):
+        async def double(x: int) -> int:
+            await asyncio.sleep(0.001 * (5 - x))
+            return x * 2
+
+        assert await gather_limited(double, range(5), concurrency=3) == [0, 2, 4, 6, 8]
+
+    async def test_concurrency_bound(self):
+        in_flight = peak = 0
+
+        async def track(_: int) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        await gather_limited(track, range(20), concurrency=4)
+        assert peak == 4
+
+    async def test_first_failure_stops_new_calls(self):
+        started: list[int] = []
+
+        async def fail_on_one(x: int) -> int:
+            started.append(x)
+            if x == 1:
+                raise RuntimeError("boom")
+            return x
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await gather_limited(fail_on_one, range(10), concurrency=2)
+        assert started == [0, 1, 2]
+
+    async def test_return_exceptions_in_place(self):
+        async def fail_on_one(x: int) -> int:
+            if x == 1:
+                raise RuntimeError("boom")
+            return x
+
+        results = await gather_limited(
+            fail_on_one, range(3), concurrency=2, return_exceptions=True
+        )
+        assert results[0] == 0
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == 2
+
+    async def test_empty_inputs(self):
+        async def never(_: int) -> None:
+            raise AssertionError
+
+        assert await gather_limited(never, []) == []
+
+    async def test_concurrency_must_be_positive(self):
+        async def noop(_: int) -> None:
+            return None
+
+        with pytest.raises(ValueError):
+            await gather_limited(noop, [1], concurrency=0)
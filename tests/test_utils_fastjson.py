@@ -0,0 +1,36 @@
+"""Tests for utils/fastjson.py — orjson fast path with stdlib fallback."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+class TestFastJson:
+    def test_dumps_returns_compact_bytes(self, codec):
+        assert codec.dumps({"a": 1, "b": [1, 2]}) == b'{"a":1,"b":[1,2]}'
+
+    def test_dumps_keeps_unicode(self, codec):
+        assert json.loads(codec.dumps({"emoji": "👍"})) == {"emoji": "👍"}
+
+    def test_dumps_default_hook(self, codec):
+        assert codec.dumps({"s": {1, 2}}, default=sorted) == b'{"s":[1,2]}'
+
+    def test_dumps_coerces_non_str_keys(self, codec):
+        assert codec.dumps({1: "a", None: "b"}) == b'{"1":"a","null":"b"}'
+
+    def test_loads_bytes_and_str(self, codec):
+        assert codec.loads(b'{"a":1}') == {"a": 1}
+        assert codec.loads('{"a":1}') == {"a": 1}
+
+    def test_loads_memoryview(self, codec):
+        assert codec.loads(memoryview(b'{"a":1}')) == {"a": 1}
+
+    def test_invalid_raises_json_decode_error(self, codec):
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"not json")
+
+    def test_invalid_utf8_raises_json_decode_error(self, codec):
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"\xff")
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import json
+
+import pytest
+from pydantic import ValidationError
+
 from tests.conftest import build_webhook_payload
+from whatsapp_cloud_api.types import WebhookMessageContext
 from whatsapp_cloud_api.webhooks.normalize import normalize_webhook
 
 
@@ -22,6 +28,21 @@ class TestNormalizeWebhookEdgeCases:
         wh = normalize_webhook([1, 2, 3])
         assert wh.messages == []
 
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, bytes.decode])
+    def test_raw_body_is_decoded(self, wrap):
+        payload = build_webhook_payload(
+            messages=[{"from": "1", "id": "wamid.1", "timestamp": "1", "type": "text"}]
+        )
+        wh = normalize_webhook(wrap(json.dumps(payload).encode()))
+        assert wh.phone_number_id == "1234567890"
+        assert wh.messages[0].id == "wamid.1"
+
+    def test_invalid_json_bytes_returns_empty(self):
+        assert normalize_webhook(b"{not json").messages == []
+
+    def test_invalid_utf8_bytes_returns_empty(self, codec):
+        assert normalize_webhook(b"\xff").messages == []
+
     def test_empty_dict(self):
         wh = normalize_webhook({})
         assert wh.messages == []
@@ -81,6 +102,55 @@ class TestNormalizeMessages:
         assert wh.messages[1].id == "m2"
 
 
+_MSG = {
+    "from": "5511999999999",
+    "id": "wamid.1",
+    "timestamp": "1234567890",
+    "type": "text",
+    "text": {"body": "Hello"},
+    "context": {"from": "5511888888888", "id": "wamid.0"},
+    "newField": {"x": 1},
+}
+
+
+class TestNormalizeValidation:
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_validated_and_constructed_paths_agree(self, validate):
+        wh = normalize_webhook(build_webhook_payload(messages=[_MSG]), validate=validate)
+        msg = wh.messages[0]
+        assert isinstance(msg.context, WebhookMessageContext)
+        assert msg.context.from_ == "5511888888888"
+        assert msg.from_ == "5511999999999"
+        assert msg.model_extra == {"new_field": {"x": 1}}
+
+    def test_missing_required_key_still_rejected(self):
+        payload = build_webhook_payload(messages=[{"id": "wamid.1", "type": "text"}])
+        with pytest.raises(ValidationError):
+            normalize_webhook(payload)
+
+    def test_bad_types_rejected_by_default(self):
+        payload = build_webhook_payload(
+            messages=[{"id": "wamid.1", "type": "text", "timestamp": "1", "text": "oops"}]
+        )
+        with pytest.raises(ValidationError):
+            normalize_webhook(payload)
+        assert normalize_webhook(payload, validate=False).messages[0].text == "oops"
+
+    def test_non_dict_context_validated_when_not_validating(self):
+        msg = {**_MSG, "context": "oops"}
+        with pytest.raises(ValidationError):
+            normalize_webhook(build_webhook_payload(messages=[msg]), validate=False)
+
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_to_bytes_matches_model_dump_json(self, validate):
+        payload = build_webhook_payload(
+            messages=[_MSG],
+            statuses=[{"id": "wamid.2", "status": "sent", "timestamp": "1"}],
+        )
+        wh = normalize_webhook(payload, validate=validate)
+        assert json.loads(wh.to_bytes()) == json.loads(wh.model_dump_json())
+
+
 class TestNormalizeStatuses:
     def test_single_status(self):
         payload = build_webhook_payload(
@@ -3,7 +3,7 @@
 import hashlib
 import hmac
 
-from whatsapp_cloud_api.webhooks.verify import verify_signature
+from whatsapp_cloud_api.webhooks.verify import verify_signature, verify_signatures_batch
 
 APP_SECRET = "test_secret_key"
 
@@ -57,6 +57,28 @@ class TestVerifySignature:
             verify_signature(app_secret=APP_SECRET, raw_body=body, signature_header=digest) is True
         )
 
+    def test_secret_as_bytes(self):
+        body = b"data"
+        sig = _sign(body)
+        assert (
+            verify_signature(app_secret=APP_SECRET.encode(), raw_body=body, signature_header=sig)
+            is True
+        )
+
+    def test_raw_body_as_memoryview(self):
+        body = b'{"test": "data"}'
+        sig = _sign(body)
+        for view in (memoryview(body), bytearray(body)):
+            assert (
+                verify_signature(app_secret=APP_SECRET, raw_body=view, signature_header=sig)
+                is True
+            )
+
+    def test_uppercase_hex_signature(self):
+        body = b"data"
+        sig = "sha256=" + _sign(body).removeprefix("sha256=").upper()
+        assert verify_signature(app_secret=APP_SECRET, raw_body=body, signature_header=sig) is True
+
     def test_wrong_secret(self):
         body = b"data"
         sig = _sign(body)
@@ -64,3 +86,25 @@ class TestVerifySignature:
             verify_signature(app_secret="wrong_secret", raw_body=body, signature_header=sig)
             is False
         )
+
+
+class TestVerifySignaturesBatch:
+    def test_mixed_results_in_order(self):
+        good = b'{"a": 1}'
+        items = [
+            (good, _sign(good)),
+            (b"tampered", _sign(good)),
+            ("text body", _sign(b"text body")),
+            (good, None),
+            (good, "sha256=nothex"),
+        ]
+        assert verify_signatures_batch(app_secret=APP_SECRET, items=items) == [
+            True,
+            False,
+            True,
+            False,
+            False,
+        ]
+
+    def test_empty(self):
+        assert verify_signatures_batch(app_secret=APP_SECRET, items=[]) == []